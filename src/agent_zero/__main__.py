@@ -0,0 +1,44 @@
+"""Console entry point for AgentZero.
+
+`agentzero --version` is answered here from the package version literal
+without importing the CLI module (click, Rich and YAML). `agentzero
+--daemon` starts the preforked server in :mod:`agent_zero.daemon`, and
+with `AGENT_ZERO_DAEMON=1` set, commands are proxied to it when it is
+running. Everything else is delegated to the click group in
+:mod:`agent_zero.cli`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from agent_zero import __version__
+
+
+def main() -> None:
+    """Run the AgentZero CLI."""
+    if sys.argv[1:] == ["--version"]:
+        print(f"agentzero, version {__version__}")
+        return
+
+    if sys.argv[1:] == ["--daemon"]:
+        from agent_zero.daemon import serve
+
+        serve()
+        return
+
+    if os.environ.get("AGENT_ZERO_DAEMON") == "1":
+        from agent_zero.daemon import try_proxy
+
+        code = try_proxy(sys.argv[1:])
+        if code is not None:
+            raise SystemExit(code)
+
+    from agent_zero.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
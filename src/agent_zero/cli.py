@@ -7,106 +7,161 @@ simulations and list completed runs.
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 import shlex
 import sys
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
-import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from rich.text import Text
 
-from .io.apply_patches import apply_patches
-from .io.hashing import make_run_id
-from .io.load_pack import load_assumptions_pack, load_manifest, load_scenario_pack
-from .io.validate import validate_assumptions_pack, validate_scenario_pack
-from .model.agents import init_agents
-from .model.simulate import simulate
-from .model.world import init_world
-from .post.export_web import export_web_bundle, rebuild_web_index
-from .post.results_pack import write_run_bundle
-from .post.results_validation import validate_bundle
+from . import __version__
+from .utils.paths import ASSUMPTIONS_PACKS_DIR, SCENARIO_PACKS_DIR, pack_stamp
 
-try:
-    from .story.generator import StoryGenerator, StoryOutput
+if TYPE_CHECKING:
+    import pandas as pd
 
-    STORY_AVAILABLE = True
-except ImportError:
-    STORY_AVAILABLE = False
-    StoryGenerator = None  # type: ignore[misc, assignment]
-    StoryOutput = None  # type: ignore[misc, assignment]
+# Pack, model and post-processing modules pull in pandas/pyarrow, and PyYAML,
+# the heavier Rich renderables (Progress, Panel, Table) and the story
+# generator are only used by a few commands, so they are imported inside the
+# functions that need them; each command only pays for its own imports.
+
+# Single source of truth shared with `agentzero --version` in __main__
+ENGINE_VERSION = __version__
 
-ENGINE_VERSION = "0.1.0"
 
 console = Console()
 
 
+# Icons are styled Text built once, so only the message itself goes through
+# the markup parser on each call
+_ICON_INFO = Text("ℹ", style="cyan")
+_ICON_SUCCESS = Text("✓", style="green")
+_ICON_WARNING = Text("⚠", style="yellow")
+_ICON_ERROR = Text("✗", style="bold red")
+_ICON_STEP = Text.assemble("  ", ("→", "dim"))
+
+
 def echo_info(msg: str) -> None:
-    console.print(f"[cyan]ℹ[/] {msg}")
+    console.print(_ICON_INFO, msg)
 
 
 def echo_success(msg: str) -> None:
-    console.print(f"[green]✓[/] {msg}")
+    console.print(_ICON_SUCCESS, msg)
 
 
 def echo_warning(msg: str) -> None:
-    console.print(f"[yellow]⚠[/] {msg}")
+    console.print(_ICON_WARNING, msg)
 
 
 def echo_error(msg: str) -> None:
-    console.print(f"[bold red]✗[/] {msg}")
+    console.print(_ICON_ERROR, msg)
 
 
 def echo_step(msg: str) -> None:
-    console.print(f"  [dim]→[/] {msg}")
+    console.print(_ICON_STEP, msg)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_manifest_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a manifest.yaml once per process.
+
+    The stat fields are part of the cache key so an edited file is
+    re-parsed. Callers must not mutate the result.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader  # type: ignore[assignment]
+
+    return yaml.load(Path(path).read_bytes(), Loader=SafeLoader)
+
+
+def _load_manifest_cached(manifest_path: Path) -> dict:
+    """Load a manifest.yaml through the in-process parse cache."""
+    manifest_path = manifest_path.resolve()
+    st = manifest_path.stat()
+    return _parse_manifest_file(str(manifest_path), st.st_mtime_ns, st.st_size)
 
 
-def parse_years(years_str: str) -> list[int]:
-    """Parse a year specification string into a list of years.
+def _cached_manifest(pack_dir: Path) -> dict:
+    """Load a pack's manifest.yaml, reusing an earlier parse in this process."""
+    return _load_manifest_cached(pack_dir / "manifest.yaml")
+
+
+def parse_years(years_str: str) -> Sequence[int]:
+    """Parse a year specification string into an ascending sequence of years.
 
     Supported formats:
     - "2024:2050" - range from 2024 to 2050 inclusive (step 1)
     - "2024:5:2050" - range from 2024 to 2050 inclusive with step 5
     - "2024,2030,2040,2050" - explicit comma-separated list
 
+    Range specifications are returned as a ``range`` rather than a
+    materialised list; explicit lists and single years as a sorted list.
+
     Args:
         years_str: The year specification string
 
     Returns:
-        A sorted list of years
+        A sorted sequence of years
 
     Raises:
         ValueError: If the format is invalid
     """
+    years = _parse_years(years_str)
+    return years if isinstance(years, range) else list(years)
+
+
+_YEAR_SEP_RE = re.compile(r"[,:]")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_years(years_str: str) -> range | tuple[int, ...]:
+    """Memoized core of parse_years; explicit lists are returned as immutable tuples."""
+    # Single plain year: skip the separator scans below
+    if years_str.isdecimal():
+        return (int(years_str),)
+
     years_str = years_str.strip()
+    # One scan finds the first separator, which decides the format
+    sep = _YEAR_SEP_RE.search(years_str)
 
-    if "," in years_str:
+    if sep is not None and sep.group() == ",":
         try:
-            year_list = [int(y.strip()) for y in years_str.split(",")]
-            return sorted(year_list)
+            # int() ignores surrounding whitespace, so no per-item strip is needed
+            return tuple(sorted(map(int, years_str.split(","))))
         except ValueError as e:
             raise ValueError(
                 f"Invalid year list format: '{years_str}'. "
                 "Expected comma-separated integers like '2024,2030,2040'"
             ) from e
 
-    if ":" in years_str:
-        parts = years_str.split(":")
-        if len(parts) == 2:
+    # Locate the remaining separators directly rather than splitting into a list
+    if sep is not None:
+        i = sep.start()
+        j = years_str.find(":", i + 1)
+        if j < 0:
             try:
-                start, end = int(parts[0]), int(parts[1])
+                start, end = int(years_str[:i]), int(years_str[i + 1 :])
                 step = 1
             except ValueError as e:
                 raise ValueError(
                     f"Invalid year range format: '{years_str}'. "
                     "Expected 'start:end' like '2024:2050'"
                 ) from e
-        elif len(parts) == 3:
+        elif years_str.find(":", j + 1) < 0:
             try:
-                start, step, end = int(parts[0]), int(parts[1]), int(parts[2])
+                start = int(years_str[:i])
+                step = int(years_str[i + 1 : j])
+                end = int(years_str[j + 1 :])
             except ValueError as e:
                 raise ValueError(
                     f"Invalid year range format: '{years_str}'. "
@@ -123,10 +178,10 @@ def parse_years(years_str: str) -> list[int]:
         if start > end:
             raise ValueError(f"Start year ({start}) must be <= end year ({end})")
 
-        return list(range(start, end + 1, step))
+        return range(start, end + 1, step)
 
     try:
-        return [int(years_str)]
+        return (int(years_str),)
     except ValueError as e:
         raise ValueError(
             f"Invalid year specification: '{years_str}'. "
@@ -146,6 +201,7 @@ WORKFLOW_HELP = """
   [cyan]2.[/] [bold]BUILD[/] a resolved assumptions table (optional, for inspection):
      $ agentzero build --assum baseline --out resolved.parquet
      $ agentzero build --assum baseline --scen high_growth --out resolved.parquet
+     $ agentzero build --assum baseline --format feather --out resolved.feather
 
   [cyan]3.[/] [bold]RUN[/] a simulation:
      $ agentzero run --assum baseline --years 2024:2050
@@ -178,46 +234,94 @@ def print_banner() -> None:
     console.print(banner)
 
 
+@functools.lru_cache(maxsize=4)
+def _welcome_screen(width: int, color_system: str | None) -> str:
+    """Render the banner and workflow help once per terminal width and colour system."""
+    with console.capture() as capture:
+        print_banner()
+        console.print()
+        console.print(WORKFLOW_HELP)
+    return capture.get()
+
+
 @click.group(invoke_without_command=True)
 @click.version_option(version=ENGINE_VERSION, prog_name="agentzero")
 @click.pass_context
 def main(ctx: click.Context) -> None:
     """AgentZero: Run agent-based simulations with assumptions and scenarios."""
     if ctx.invoked_subcommand is None:
-        print_banner()
-        console.print()
-        console.print(WORKFLOW_HELP)
+        console.file.write(_welcome_screen(console.width, console.color_system))
+        console.file.flush()
 
 
-@main.command("validate-inputs")
-@click.argument("pack_path")
-def validate_inputs(pack_path: str) -> None:
-    """Validate an assumptions or scenario pack.
+_PACK_TYPES = ("assumptions", "scenario")
 
-    PACK_PATH should point at the directory containing the pack's
-    manifest.yaml. The command prints 'OK' on success and otherwise
-    lists validation errors before exiting with code 1.
+
+def _validate_pack(pack_path: str) -> tuple[str | None, list[str]]:
+    """Load and validate a single pack.
+
+    Returns the pack type from the manifest and the list of validation
+    errors. Packs with an unknown type are returned without validation.
+    Runs in worker processes for batch validation, so it must stay at
+    module level.
     """
-    console.rule("[bold cyan]Validating Pack[/]")
+    from .io.load_pack import load_assumptions_pack, load_scenario_pack
+    from .io.validate import validate_assumptions_pack, validate_scenario_pack
 
     p = Path(pack_path)
-    echo_info(f"Reading manifest from [dim]{p}[/]")
-    manifest = load_manifest(p)
-    pack_type = manifest.get("type")
-
+    pack_type = _cached_manifest(p).get("type")
     if pack_type == "assumptions":
-        echo_info("Detected [bold]assumptions[/] pack")
-        pack = load_assumptions_pack(p)
-        errs = validate_assumptions_pack(pack)
-    elif pack_type == "scenario":
-        echo_info("Detected [bold]scenario[/] pack")
-        pack = load_scenario_pack(p)
-        errs = validate_scenario_pack(pack)
-    else:
-        raise click.ClickException(
-            f"Unknown pack type '{pack_type}' in manifest.yaml; "
-            "expected 'assumptions' or 'scenario'."
+        return pack_type, validate_assumptions_pack(load_assumptions_pack(p))
+    if pack_type == "scenario":
+        return pack_type, validate_scenario_pack(load_scenario_pack(p))
+    return pack_type, []
+
+
+def _unknown_pack_type_message(pack_type: str | None) -> str:
+    return (
+        f"Unknown pack type '{pack_type}' in manifest.yaml; expected 'assumptions' or 'scenario'."
+    )
+
+
+@main.command("validate-inputs")
+@click.argument("pack_paths", nargs=-1)
+@click.option(
+    "--all",
+    "validate_all",
+    is_flag=True,
+    help="Also validate every pack under data/assumptions_packs and data/scenario_packs",
+)
+def validate_inputs(pack_paths: tuple[str, ...], validate_all: bool) -> None:
+    """Validate one or more assumptions or scenario packs.
+
+    Each PACK_PATH should point at the directory containing the pack's
+    manifest.yaml. The command reports success or lists validation errors
+    before exiting with code 1. When several packs are given they are
+    validated in parallel worker processes and the exit code is 1 if any
+    pack fails.
+    """
+    if validate_all:
+        pack_paths += tuple(
+            e.path
+            for packs_dir in (ASSUMPTIONS_PACKS_DIR, SCENARIO_PACKS_DIR)
+            if packs_dir.is_dir()
+            for e in _list_subdirs(packs_dir)
         )
+    if not pack_paths:
+        raise click.UsageError("Give at least one PACK_PATH, or use --all.")
+
+    if len(pack_paths) > 1:
+        _validate_inputs_batch(pack_paths)
+        return
+
+    console.rule("[bold cyan]Validating Pack[/]")
+
+    p = Path(pack_paths[0])
+    echo_info(f"Reading manifest from [dim]{p}[/]")
+    pack_type, errs = _validate_pack(pack_paths[0])
+    if pack_type not in _PACK_TYPES:
+        raise click.ClickException(_unknown_pack_type_message(pack_type))
+    echo_info(f"Detected [bold]{pack_type}[/] pack")
 
     if errs:
         console.print()
@@ -230,17 +334,132 @@ def validate_inputs(pack_path: str) -> None:
     echo_success("Pack is valid")
 
 
+def _validate_inputs_batch(pack_paths: tuple[str, ...]) -> None:
+    """Validate several packs in a process pool and report a summary."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    console.rule("[bold cyan]Validating Packs[/]")
+    echo_info(f"Validating [bold]{len(pack_paths)}[/] packs")
+    console.print()
+
+    failed = 0
+    max_workers = min(len(pack_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        futures = [ex.submit(_validate_pack, pack_path) for pack_path in pack_paths]
+        for pack_path, future in zip(pack_paths, futures, strict=True):
+            try:
+                pack_type, errs = future.result()
+            except Exception as e:
+                pack_type, errs = None, [f"{type(e).__name__}: {e}"]
+            else:
+                if pack_type not in _PACK_TYPES:
+                    errs = [_unknown_pack_type_message(pack_type)]
+
+            if errs:
+                failed += 1
+                echo_error(f"[dim]{pack_path}[/]")
+                for err in errs:
+                    console.print(f"    [red]•[/] {err}")
+            else:
+                echo_success(f"[dim]{pack_path}[/] ({pack_type})")
+
+    console.print()
+    if failed:
+        echo_error(f"{failed} of {len(pack_paths)} pack(s) failed validation")
+        raise SystemExit(1)
+    echo_success(f"All {len(pack_paths)} packs are valid")
+
+
+def _load_resolved(
+    assum: str,
+    scen: str | None,
+    status: Callable[[str], None] | None = None,
+    model_columns_only: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict, dict | None]:
+    """Load a baseline assumptions pack and apply a scenario pack's patches, if any.
+
+    Returns (assumptions, policy, assumptions_manifest, scenario_manifest),
+    where scenario_manifest is None when no scenario is given. If `status`
+    is provided it is called with a short description before each step.
+    `model_columns_only` is passed through to `load_assumptions_pack`.
+    """
+    from .io.apply_patches import apply_patches
+    from .io.load_pack import load_assumptions_pack, load_scenario_pack
+
+    if status:
+        status("Loading assumptions pack...")
+    ap = load_assumptions_pack(ASSUMPTIONS_PACKS_DIR / assum, model_columns_only)
+    assumptions, policy = ap["assumptions"], ap["policy"]
+    if not scen:
+        return assumptions, policy, ap["manifest"], None
+
+    sp_path = SCENARIO_PACKS_DIR / scen
+    if status:
+        status(f"Applying scenario patches from [dim]{sp_path}[/]")
+    sp = load_scenario_pack(sp_path)
+    assumptions, policy = apply_patches(assumptions, policy, sp["patches"])
+    return assumptions, policy, ap["manifest"], sp["manifest"]
+
+
+def _build_inputs_key(pack_dirs: list[Path], out_format: str) -> dict:
+    """Describe the inputs of a build by the (name, mtime, size) of each pack file.
+
+    Only stat calls are made, so checking whether a build is current does
+    not need to parse manifests or load any tables.
+    """
+    # Lists, so the key compares equal to its JSON round trip in the sidecar
+    packs = [[str(d), [list(f) for f in pack_stamp(d)]] for d in pack_dirs]
+    return {"engine_version": ENGINE_VERSION, "format": out_format, "packs": packs}
+
+
+def _output_stamp(out: Path) -> list[int]:
+    st = out.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _build_is_current(out: Path, sidecar: Path, key: dict) -> bool:
+    """Return True if OUT was written by a build with exactly these inputs."""
+    import json
+
+    try:
+        recorded = json.loads(sidecar.read_text(encoding="utf-8"))
+        return recorded["inputs"] == key and recorded["output"] == _output_stamp(out)
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _write_build_sidecar(out: Path, sidecar: Path, key: dict) -> None:
+    """Record the build inputs next to OUT, replacing any previous record atomically."""
+    import json
+
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"inputs": key, "output": _output_stamp(out)}), encoding="utf-8")
+    os.replace(tmp, sidecar)
+
+
 @main.command()
 @click.option("--assum", required=True, help="Assumptions pack name under data/assumptions_packs")
 @click.option("--scen", required=False, help="Scenario pack name under data/scenario_packs")
+@click.option("--out", required=True, help="Output file path for resolved assumptions table")
 @click.option(
-    "--out", required=True, help="Output Parquet file path for resolved assumptions table"
+    "--format",
+    "out_format",
+    default="parquet",
+    show_default=True,
+    type=click.Choice(["parquet", "feather"]),
+    help="Output format; feather is written with zstd compression and is fastest to read back",
 )
-def build(assum: str, scen: str | None, out: str) -> None:
+@click.option("--force", is_flag=True, help="Rebuild even if OUT is up to date")
+def build(assum: str, scen: str | None, out: str, out_format: str, force: bool) -> None:
     """Build a resolved assumptions table from a baseline and scenario.
 
     This command applies scenario patches to the baseline assumptions and
-    policy tables and writes the resolved assumptions table to OUT.
+    policy tables and writes the resolved assumptions table to OUT as
+    Parquet (default) or Feather.
+
+    A small OUT.agentzero-key file records the pack files the table was
+    built from; if neither they nor OUT have changed since, the build is
+    skipped (use --force to rebuild anyway).
     """
     console.rule("[bold cyan]Building Resolved Assumptions[/]")
 
@@ -250,20 +469,35 @@ def build(assum: str, scen: str | None, out: str) -> None:
     else:
         echo_info("Scenario: [dim](none)[/]")
 
-    ap_path = Path("data/assumptions_packs") / assum
-    echo_step("Loading assumptions pack...")
-    ap = load_assumptions_pack(ap_path)
-    assumptions = ap["assumptions"]
-    policy = ap["policy"]
+    ap_path = ASSUMPTIONS_PACKS_DIR / assum
+    sp_path = SCENARIO_PACKS_DIR / scen if scen else None
+    out_path = Path(out)
+    sidecar = out_path.with_name(out_path.name + ".agentzero-key")
+    key = _build_inputs_key([ap_path] if sp_path is None else [ap_path, sp_path], out_format)
+    if not force and _build_is_current(out_path, sidecar, key):
+        console.print()
+        echo_success(f"[bold green]{out}[/] is up to date")
+        return
 
-    if scen:
-        sp_path = Path("data/scenario_packs") / scen
-        echo_step(f"Applying scenario patches from [dim]{sp_path}[/]")
-        sp = load_scenario_pack(sp_path)
-        assumptions, policy = apply_patches(assumptions, policy, sp["patches"])
+    assumptions, _, _, _ = _load_resolved(assum, scen, status=echo_step)
 
-    Path(out).parent.mkdir(parents=True, exist_ok=True)
-    assumptions.to_parquet(out, index=False)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if out_format == "feather":
+        assumptions.to_feather(out, compression="zstd", compression_level=3)
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(assumptions, preserve_index=False)
+        pq.write_table(
+            table,
+            out,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            row_group_size=64_000,
+        )
+    _write_build_sidecar(out_path, sidecar, key)
 
     console.print()
     echo_success(f"Wrote resolved assumptions to [bold green]{out}[/]")
@@ -290,7 +524,16 @@ def run(assum: str, scen: str | None, years: str, seed: int, out: str) -> None:
 
     The output directory will be created if it does not exist.
     """
-    cli_command = " ".join(shlex.quote(arg) for arg in sys.argv)
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from .io.hashing import make_run_id
+    from .model.agents import init_agents
+    from .model.simulate import simulate
+    from .model.world import init_world
+    from .post.results_pack import write_run_bundle
+
+    cli_command = shlex.join(sys.argv)
 
     console.rule("[bold cyan]Running Simulation[/]")
 
@@ -299,8 +542,9 @@ def run(assum: str, scen: str | None, years: str, seed: int, out: str) -> None:
     except ValueError as e:
         raise click.BadParameter(str(e)) from e
 
-    start_year = min(year_list)
-    end_year = max(year_list)
+    # parse_years returns years in ascending order (a range or a sorted list)
+    start_year = year_list[0]
+    end_year = year_list[-1]
 
     if len(year_list) == 1:
         echo_info(f"Year: [bold cyan]{year_list[0]}[/]")
@@ -319,20 +563,17 @@ def run(assum: str, scen: str | None, years: str, seed: int, out: str) -> None:
         TextColumn("[progress.description]{task.description}"),
         console=console,
         transient=True,
+        # No spinner redraws when output goes to a log or CI
+        disable=not console.is_terminal,
     ) as progress:
         task = progress.add_task("Loading input data...", total=None)
 
-        ap_path = Path("data/assumptions_packs") / assum
-        ap = load_assumptions_pack(ap_path)
-        assumptions = ap["assumptions"]
-        policy = ap["policy"]
-        sp = None
-
-        if scen:
-            progress.update(task, description="Applying scenario patches...")
-            sp_path = Path("data/scenario_packs") / scen
-            sp = load_scenario_pack(sp_path)
-            assumptions, policy = apply_patches(assumptions, policy, sp["patches"])
+        assumptions, policy, ap_manifest, sp_manifest = _load_resolved(
+            assum,
+            scen,
+            status=lambda msg: progress.update(task, description=msg),
+            model_columns_only=True,
+        )
 
         progress.update(task, description="Initializing world and agents...")
         world0 = init_world(assumptions, policy, start_year=start_year)
@@ -344,15 +585,15 @@ def run(assum: str, scen: str | None, years: str, seed: int, out: str) -> None:
         progress.update(task, description="Writing run bundle...")
         run_id = make_run_id(
             ENGINE_VERSION,
-            ap["manifest"].get("hash", "NA"),
-            sp["manifest"].get("hash", "NA") if sp else None,
+            ap_manifest.get("hash", "NA"),
+            sp_manifest.get("hash", "NA") if sp_manifest else None,
             years=year_list,
             seed=seed,
         )
 
         manifests = {
-            "assumptions": ap["manifest"],
-            "scenario": sp["manifest"] if sp else {},
+            "assumptions": ap_manifest,
+            "scenario": sp_manifest or {},
         }
         out_dir = write_run_bundle(
             Path(out), run_id, history, manifests, seed=seed, cli_command=cli_command
@@ -374,12 +615,15 @@ def run(assum: str, scen: str | None, years: str, seed: int, out: str) -> None:
 @main.command()
 def runs() -> None:
     """List all previously executed runs."""
+    from rich.live import Live
+    from rich.table import Table
+
     rdir = Path("runs")
     if not rdir.exists():
         echo_warning("No runs directory found ([dim]runs/[/]).")
         return
 
-    run_dirs = [p for p in sorted(rdir.iterdir()) if p.is_dir()]
+    run_dirs = _list_subdirs(rdir)
     if not run_dirs:
         echo_warning("No runs found in [dim]runs/[/].")
         return
@@ -390,30 +634,66 @@ def runs() -> None:
     table.add_column("Assumptions", style="green")
     table.add_column("Scenario", style="yellow")
 
-    for rd in run_dirs:
-        manifest_path = rd / "manifest.yaml"
-        years_str = "-"
-        assum_name = "-"
-        scen_name = "-"
+    index = _load_runs_index(rdir)
+
+    # Rows are shown as each manifest is parsed rather than after all of them
+    with Live(table, console=console, refresh_per_second=10):
+        for entry in run_dirs:
+            manifest_path = Path(entry.path) / "manifest.yaml"
+            try:
+                st = manifest_path.stat()
+            except OSError:
+                m = None
+            else:
+                # Runs whose manifest is unchanged since it was indexed skip the YAML parse
+                m = index.get(entry.name)
+                if not isinstance(m, dict) or m.get("manifest_stat") != [
+                    st.st_mtime_ns,
+                    st.st_size,
+                ]:
+                    m = _load_manifest_cached(manifest_path)
+            # Plain Text cells take the column style without a markup parse
+            table.add_row(*map(Text, (entry.name, *_run_cells(m))))
+
+
+def _load_runs_index(rdir: Path) -> dict:
+    """Load runs/index.json written by write_run_bundle.
+
+    Returns an empty index if the file is missing or unreadable.
+    """
+    import json
 
-        if manifest_path.exists():
-            with manifest_path.open() as f:
-                m = yaml.safe_load(f)
-            years_info = m.get("years", {})
-            if isinstance(years_info, dict):
-                start = years_info.get("start", "?")
-                end = years_info.get("end", "?")
-                years_str = f"{start}–{end}"
-            assum_info = m.get("assumptions", {})
-            if isinstance(assum_info, dict):
-                assum_name = assum_info.get("name", "-")
-            scen_info = m.get("scenario", {})
-            if isinstance(scen_info, dict):
-                scen_name = scen_info.get("name", "-") if scen_info else "-"
+    from .post.results_pack import RUNS_INDEX
 
-        table.add_row(rd.name, years_str, assum_name, scen_name)
+    try:
+        index = json.loads((rdir / RUNS_INDEX).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
 
-    console.print(table)
+
+def _run_cells(m: dict | None) -> tuple[str, str, str]:
+    """Return the (years, assumptions, scenario) cells for a run in the runs table."""
+    years_str = "-"
+    assum_name = "-"
+    scen_name = "-"
+
+    if m:
+        years_info = m.get("years", {})
+        if isinstance(years_info, list) and years_info:
+            years_str = f"{min(years_info)}–{max(years_info)}"
+        elif isinstance(years_info, dict):
+            start = years_info.get("start", "?")
+            end = years_info.get("end", "?")
+            years_str = f"{start}–{end}"
+        assum_info = m.get("assumptions", {})
+        if isinstance(assum_info, dict):
+            assum_name = assum_info.get("id") or assum_info.get("name", "-")
+        scen_info = m.get("scenario", {})
+        if isinstance(scen_info, dict) and scen_info:
+            scen_name = scen_info.get("id") or scen_info.get("name", "-")
+
+    return years_str, assum_name, scen_name
 
 
 @main.command("validate-outputs")
@@ -424,6 +704,8 @@ def validate_outputs(run_dir: Path) -> None:
     RUN_DIR is the path to a results bundle directory containing
     timeseries.parquet, agent_states.parquet, summary.json, and manifest.yaml.
     """
+    from .post.results_validation import validate_bundle
+
     console.rule("[bold cyan]Validating Results Bundle[/]")
     echo_info(f"Bundle: [dim]{run_dir}[/]")
 
@@ -451,44 +733,45 @@ def validate_outputs(run_dir: Path) -> None:
     raise SystemExit(1 if errors else 0)
 
 
-def _get_run_info(run_dir: Path) -> dict:
-    """Extract useful info from a run's manifest for display."""
+def _get_run_info(run_dir: Path) -> tuple[dict, dict | None]:
+    """Extract useful info from a run's manifest for display.
+
+    Returns the display info and the parsed manifest (None if the run has
+    no manifest.yaml), so callers can reuse the parse.
+    """
     manifest_path = run_dir / "manifest.yaml"
+    m = _load_manifest_cached(manifest_path) if manifest_path.exists() else None
+    # Same cell formatting as the `runs` table, so the two listings agree
+    years, assumptions, scenario = _run_cells(m)
     info = {
         "run_id": run_dir.name,
-        "years": "-",
-        "assumptions": "-",
-        "scenario": "-",
-        "timestamp": "-",
+        "years": years,
+        "assumptions": assumptions,
+        "scenario": scenario,
+        "timestamp": m.get("run_timestamp", "-") if m else "-",
     }
-    if manifest_path.exists():
-        with manifest_path.open() as f:
-            m = yaml.safe_load(f)
-        years_info = m.get("years", {})
-        if isinstance(years_info, list) and years_info:
-            info["years"] = f"{min(years_info)}–{max(years_info)}"
-        elif isinstance(years_info, dict):
-            start = years_info.get("start", "?")
-            end = years_info.get("end", "?")
-            info["years"] = f"{start}–{end}"
-        assum_info = m.get("assumptions", {})
-        if isinstance(assum_info, dict):
-            info["assumptions"] = assum_info.get("id") or assum_info.get("name", "-")
-        scen_info = m.get("scenario", {})
-        if isinstance(scen_info, dict) and scen_info:
-            info["scenario"] = scen_info.get("id") or scen_info.get("name", "-")
-        info["timestamp"] = m.get("run_timestamp", "-")
-    return info
+    return info, m
+
+
+def _list_subdirs(root: Path) -> list[os.DirEntry[str]]:
+    """List the subdirectories of root (runs or packs), sorted by name.
+
+    scandir reuses the d_type from the directory listing, so the directory
+    check needs no stat per entry, and DirEntry caches any later stat().
+    """
+    with os.scandir(root) as it:
+        return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
 
 
 def _find_most_recent_run(runs_dir: Path) -> Path | None:
     """Find the most recently modified run directory."""
-    if not runs_dir.exists():
-        return None
-    run_dirs = [p for p in runs_dir.iterdir() if p.is_dir()]
-    if not run_dirs:
+    # One unsorted scandir pass; each DirEntry is stat'ed once
+    try:
+        with os.scandir(runs_dir) as it:
+            latest = max(((e.stat().st_mtime, e.path) for e in it if e.is_dir()), default=None)
+    except FileNotFoundError:
         return None
-    return max(run_dirs, key=lambda p: p.stat().st_mtime)
+    return Path(latest[1]) if latest else None
 
 
 def _is_already_exported(run_dir: Path, out_dir: Path) -> bool:
@@ -498,16 +781,57 @@ def _is_already_exported(run_dir: Path, out_dir: Path) -> bool:
     return exported_manifest.exists()
 
 
-def _export_single_run(run_dir: Path, out: Path, force: bool = False) -> bool:
-    """Export a single run. Returns True if exported, False if skipped."""
-    run_id = run_dir.name
-    if _is_already_exported(run_dir, out) and not force:
-        echo_warning(f"Run [cyan]{run_id}[/] already exported (use --force to re-export)")
-        return False
+def _exported_run_ids(out_dir: Path) -> frozenset[str]:
+    """Return the IDs of all runs already exported to the web directory.
+
+    One directory listing replaces a per-run path lookup; only the
+    exported run directories are checked for their manifest.json.
+    """
+    try:
+        with os.scandir(out_dir / "runs") as it:
+            return frozenset(
+                e.name
+                for e in it
+                if e.is_dir() and os.path.exists(os.path.join(e.path, "manifest.json"))
+            )
+    except FileNotFoundError:
+        return frozenset()
 
-    echo_info(f"Exporting: [cyan]{run_id}[/]")
-    export_web_bundle(run_dir, out / "runs" / run_id)
-    return True
+
+def _export_runs(
+    run_dirs: list[Path], out: Path, jobs: int | None
+) -> Iterator[tuple[Path, FileNotFoundError | None]]:
+    """Export runs to OUT/runs/<run_id>, yielding (run_dir, error) as each finishes.
+
+    Each export reads Parquet and writes JSON independently, so runs are
+    spread over a process pool; with a single job (or a single run) they
+    are exported in-process. Only missing-file errors are reported per run;
+    anything else propagates.
+    """
+    from .post.export_web import export_web_bundle
+
+    max_workers = min(len(run_dirs), jobs or os.cpu_count() or 1)
+    if max_workers <= 1:
+        for rd in run_dirs:
+            try:
+                export_web_bundle(rd, out / "runs" / rd.name)
+            except FileNotFoundError as e:
+                yield rd, e
+            else:
+                yield rd, None
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(export_web_bundle, rd, out / "runs" / rd.name): rd for rd in run_dirs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except FileNotFoundError as e:
+                yield futures[future], e
+            else:
+                yield futures[future], None
 
 
 @main.command("export-web")
@@ -538,6 +862,13 @@ def _export_single_run(run_dir: Path, out: Path, force: bool = False) -> bool:
     is_flag=True,
     help="Skip rebuilding the runs index after export",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of runs to export in parallel with --all (default: CPU count)",
+)
 @click.option(
     "-y",
     "--yes",
@@ -545,7 +876,13 @@ def _export_single_run(run_dir: Path, out: Path, force: bool = False) -> bool:
     help="Skip confirmation prompts",
 )
 def export_web(
-    run_dir: Path | None, out: Path, export_all: bool, force: bool, no_index: bool, yes: bool
+    run_dir: Path | None,
+    out: Path,
+    export_all: bool,
+    force: bool,
+    no_index: bool,
+    jobs: int | None,
+    yes: bool,
 ) -> None:
     """Export a run bundle for web consumption.
 
@@ -553,10 +890,15 @@ def export_web(
     for the SvelteKit web frontend.
 
     If no --run-dir is specified, exports the most recent run (with confirmation).
-    Use --all to export all runs from the runs/ directory.
+    Use --all to export all runs from the runs/ directory; runs are
+    exported in parallel across --jobs worker processes.
 
     Automatically rebuilds runs/index.json after export (use --no-index to skip).
     """
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+    from .post.export_web import export_web_bundle, rebuild_web_index
+
     console.rule("[bold cyan]Exporting Web Bundle[/]")
     runs_dir = Path("runs")
     exported_any = False
@@ -565,7 +907,7 @@ def export_web(
         if not runs_dir.exists():
             echo_error("No runs directory found.")
             raise SystemExit(1)
-        run_dirs = sorted([p for p in runs_dir.iterdir() if p.is_dir()])
+        run_dirs = [Path(e.path) for e in _list_subdirs(runs_dir)]
         if not run_dirs:
             echo_error("No runs found in runs/")
             raise SystemExit(1)
@@ -574,16 +916,38 @@ def export_web(
         echo_info(f"Output: [dim]{out}[/]")
         console.print()
 
-        exported = 0
+        pending = []
         skipped = 0
-        for rd in run_dirs:
-            try:
-                if _export_single_run(rd, out, force):
+        exported_ids = frozenset() if force else _exported_run_ids(out)
+        # Buffer the per-run status lines and write them to the terminal in one go
+        with console:
+            for rd in run_dirs:
+                if rd.name in exported_ids:
+                    echo_warning(
+                        f"Run [cyan]{rd.name}[/] already exported (use --force to re-export)"
+                    )
+                    skipped += 1
+                else:
+                    pending.append(rd)
+
+        exported = 0
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+            disable=not console.is_terminal,
+        ) as progress:
+            task = progress.add_task("Exporting runs...", total=len(pending))
+            for rd, err in _export_runs(pending, out, jobs):
+                if err is None:
+                    echo_info(f"Exported: [cyan]{rd.name}[/]")
                     exported += 1
                 else:
-                    skipped += 1
-            except FileNotFoundError as e:
-                echo_error(f"Failed to export {rd.name}: {e}")
+                    echo_error(f"Failed to export {rd.name}: {err}")
+                progress.advance(task)
 
         console.print()
         if exported > 0:
@@ -593,25 +957,29 @@ def export_web(
             echo_info(f"Skipped [dim]{skipped}[/] already-exported run(s)")
 
     else:
+        manifest = None
         if run_dir is None:
             run_dir = _find_most_recent_run(runs_dir)
             if run_dir is None:
                 echo_error("No runs found. Run a simulation first or specify --run-dir.")
                 raise SystemExit(1)
 
-            info = _get_run_info(run_dir)
+            info, manifest = _get_run_info(run_dir)
             already_exported = _is_already_exported(run_dir, out)
 
-            console.print()
-            console.print("[bold]Most recent run:[/]")
-            console.print(f"  Run ID:      [cyan]{info['run_id']}[/]")
-            console.print(f"  Years:       [magenta]{info['years']}[/]")
-            console.print(f"  Assumptions: [green]{info['assumptions']}[/]")
-            console.print(f"  Scenario:    [yellow]{info['scenario']}[/]")
-            console.print(f"  Timestamp:   [dim]{info['timestamp']}[/]")
+            lines = [
+                "",
+                "[bold]Most recent run:[/]",
+                f"  Run ID:      [cyan]{info['run_id']}[/]",
+                f"  Years:       [magenta]{info['years']}[/]",
+                f"  Assumptions: [green]{info['assumptions']}[/]",
+                f"  Scenario:    [yellow]{info['scenario']}[/]",
+                f"  Timestamp:   [dim]{info['timestamp']}[/]",
+            ]
             if already_exported:
-                console.print("  Status:      [yellow]Already exported[/]")
-            console.print()
+                lines.append("  Status:      [yellow]Already exported[/]")
+            lines.append("")
+            console.print("\n".join(lines))
 
             if already_exported and not force:
                 echo_warning("This run has already been exported. Use --force to re-export.")
@@ -627,7 +995,7 @@ def export_web(
         echo_info(f"Output: [dim]{run_out}[/]")
 
         try:
-            export_web_bundle(run_dir, run_out)
+            export_web_bundle(run_dir, run_out, manifest=manifest)
             console.print()
             echo_success(f"Web bundle exported to [bold green]{run_out}[/]")
             exported_any = True
@@ -654,6 +1022,8 @@ def rebuild_web_index_cmd(web_dir: Path) -> None:
 
     Scans web_dir/runs/*/manifest.json and creates web_dir/runs/index.json.
     """
+    from .post.export_web import rebuild_web_index
+
     console.rule("[bold cyan]Rebuilding Web Index[/]")
     echo_info(f"Scanning: [dim]{web_dir}[/]")
 
@@ -709,14 +1079,19 @@ def generate_story(
     force: bool,
 ) -> None:
     """Generate a narrative story for a simulation run."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     console.rule("[bold cyan]Generating Story[/]")
 
-    if not STORY_AVAILABLE:
+    try:
+        from .story.generator import StoryGenerator, StoryOutput
+    except ImportError as e:
         echo_error(
             "Story generation requires the 'story' extra. "
             "Install with: pip install 'agent-zero[story]'"
         )
-        raise SystemExit(1)
+        raise SystemExit(1) from e
 
     output_path = out or (run_dir / "story.md")
     provenance_path = output_path.with_suffix(".story_provenance.json")
@@ -735,15 +1110,12 @@ def generate_story(
         echo_error(f"Missing timeseries.parquet in run directory: {run_dir}")
         raise SystemExit(1)
 
-    if not offline:
-        import os
-
-        if not os.environ.get("ANTHROPIC_API_KEY"):
-            echo_error(
-                "ANTHROPIC_API_KEY environment variable is not set. "
-                "Either set it or use --offline for template-based generation."
-            )
-            raise SystemExit(1)
+    if not offline and not os.environ.get("ANTHROPIC_API_KEY"):
+        echo_error(
+            "ANTHROPIC_API_KEY environment variable is not set. "
+            "Either set it or use --offline for template-based generation."
+        )
+        raise SystemExit(1)
 
     echo_info(f"Run directory: [dim]{run_dir}[/]")
     echo_info(f"Audience: [bold cyan]{audience}[/]")
@@ -757,6 +1129,8 @@ def generate_story(
         TextColumn("[progress.description]{task.description}"),
         console=console,
         transient=True,
+        # No spinner redraws when output goes to a log or CI
+        disable=not console.is_terminal,
     ) as progress:
         progress.add_task("Generating story...", total=None)
 
@@ -771,15 +1145,21 @@ def generate_story(
         else:
             result = generator.generate()
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(result.story_markdown)
+    try:
+        import orjson
+    except ImportError:
+        import json
+        from dataclasses import asdict
 
-    import json
-    from dataclasses import asdict
+        # asdict already recurses into the ToolCall records
+        provenance = json.dumps(asdict(result.provenance), indent=2).encode()
+    else:
+        # orjson serialises the nested dataclasses natively in one pass
+        provenance = orjson.dumps(result.provenance, option=orjson.OPT_INDENT_2)
 
-    provenance_dict = asdict(result.provenance)
-    provenance_dict["tools_called"] = [asdict(tc) for tc in result.provenance.tools_called]
-    provenance_path.write_text(json.dumps(provenance_dict, indent=2))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(result.story_markdown)
+    provenance_path.write_bytes(provenance)
 
     word_count = len(result.story_markdown.split())
     section_count = result.story_markdown.count("\n## ")
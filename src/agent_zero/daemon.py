@@ -0,0 +1,284 @@
+"""Opt-in preforked server for repeated CLI invocations.
+
+`agentzero --daemon` starts a long-lived process that imports the CLI and
+the pandas-backed pack, model and post-processing modules once, then
+listens on a Unix socket. When `AGENT_ZERO_DAEMON=1` is set, later
+`agentzero ...` invocations connect to that socket and hand over their
+arguments, working directory, environment and stdin/stdout/stderr file
+descriptors. The daemon forks a child per request which runs the command
+against the caller's terminal and reports the exit code back, so the
+caller skips interpreter start-up and the heavy imports entirely.
+
+The socket lives in a private (0700, owned by the current user) directory,
+and the client checks with `SO_PEERCRED` that the listening process runs
+as the same user before handing anything over. Only the environment
+variables the CLI reads (see `_FORWARDED_ENV`) are forwarded.
+
+The pack directories (`AGENT_ZERO_ASSUM_DIR` / `AGENT_ZERO_SCEN_DIR`) are
+re-resolved from the caller's environment in each forked child.
+
+Caveats: code changes are not picked up until the daemon is restarted. Linux only (peer credentials); elsewhere commands
+always run in-process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from collections.abc import Mapping
+from pathlib import Path
+
+_HEADER = struct.Struct("!I")
+_EXIT_CODE = struct.Struct("!i")
+# struct ucred returned by SO_PEERCRED: pid, uid, gid
+_UCRED = struct.Struct("3i")
+
+# Environment variables the CLI (and Rich's terminal detection) reads;
+# nothing else from the caller's environment is sent to the daemon
+_FORWARDED_ENV = frozenset(
+    {
+        "ANTHROPIC_API_KEY",
+        "COLORTERM",
+        "COLUMNS",
+        "FORCE_COLOR",
+        "LANG",
+        "LC_ALL",
+        "LC_CTYPE",
+        "LINES",
+        "NO_COLOR",
+        "TERM",
+    }
+)
+_FORWARDED_PREFIX = "AGENT_ZERO_"
+
+
+def socket_dir() -> Path:
+    """Return the private directory holding the daemon socket."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "agent_zero"
+    return Path(tempfile.gettempdir()) / f"agent_zero-{os.getuid()}"
+
+
+def socket_path() -> Path:
+    """Return the Unix socket path used by the daemon and its clients."""
+    return socket_dir() / "daemon.sock"
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Return True if path is a real directory owned by us with no group/other access."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) & 0o077 == 0
+    )
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """Return the uid of the process at the other end of a Unix socket, if known."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _UCRED.size)
+    return _UCRED.unpack(creds)[1]
+
+
+def _forwarded_env(environ: Mapping[str, str]) -> dict[str, str]:
+    """Select the caller's environment variables that are passed to the daemon."""
+    return {
+        key: value
+        for key, value in environ.items()
+        if key in _FORWARDED_ENV or key.startswith(_FORWARDED_PREFIX)
+    }
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    """Receive exactly n bytes, or fewer if the peer closes the connection."""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return bytes(buf)
+
+
+def try_proxy(argv: list[str]) -> int | None:
+    """Run a CLI invocation through a running daemon.
+
+    Returns the command's exit code, or None if no trusted daemon is
+    listening (the caller should then run the command in-process). The
+    socket must sit in a private directory and the listening process must
+    run as the current user; otherwise nothing is sent.
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "SO_PEERCRED"):
+        return None
+    if not _is_private_dir(socket_dir()):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path()))
+        trusted = _peer_uid(sock) == os.getuid()
+    except OSError:
+        trusted = False
+    if not trusted:
+        sock.close()
+        return None
+
+    with sock:
+        env = _forwarded_env(os.environ)
+        payload = json.dumps({"argv": argv, "cwd": os.getcwd(), "env": env})
+        data = payload.encode("utf-8")
+        socket.send_fds(sock, [_HEADER.pack(len(data))], [0, 1, 2])
+        sock.sendall(data)
+        reply = _recv_exact(sock, _EXIT_CODE.size)
+    if len(reply) != _EXIT_CODE.size:
+        print("agentzero: daemon closed the connection unexpectedly", file=sys.stderr)
+        return 1
+    return _EXIT_CODE.unpack(reply)[0]
+
+
+def _preload() -> None:
+    """Import the modules every command would otherwise load on start-up."""
+    import agent_zero.cli
+    import agent_zero.io.apply_patches
+    import agent_zero.io.load_pack
+    import agent_zero.io.validate
+    import agent_zero.model.simulate
+    import agent_zero.post.export_web
+    import agent_zero.post.results_pack
+    import agent_zero.post.results_validation  # noqa: F401
+
+
+def _rebind_pack_dirs() -> None:
+    """Re-resolve the pack directories from the current environment.
+
+    Modules bind ASSUMPTIONS_PACKS_DIR / SCENARIO_PACKS_DIR when the daemon
+    imports them, so every loaded agent_zero module holding them is updated.
+    """
+    from agent_zero.utils.paths import pack_dirs
+
+    assum_dir, scen_dir = pack_dirs()
+    for name, module in list(sys.modules.items()):
+        if name.split(".")[0] == "agent_zero" and hasattr(module, "ASSUMPTIONS_PACKS_DIR"):
+            module.ASSUMPTIONS_PACKS_DIR = assum_dir  # type: ignore[attr-defined]
+            module.SCENARIO_PACKS_DIR = scen_dir  # type: ignore[attr-defined]
+
+
+def _run_cli(argv: list[str]) -> int:
+    """Run the click CLI in the current (forked) process and return its exit code."""
+    from rich.console import Console
+
+    from agent_zero import cli
+
+    # Re-detect colour support and width against the caller's terminal
+    cli.console = Console()
+    try:
+        cli.main.main(args=argv, prog_name="agentzero", standalone_mode=True)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _handle(conn: socket.socket) -> None:
+    """Service a single client request in a forked child."""
+    if _peer_uid(conn) != os.getuid():
+        return
+    header, fds, _, _ = socket.recv_fds(conn, _HEADER.size, 3)
+    if not header:
+        return  # liveness probe from try_connect
+    header += _recv_exact(conn, _HEADER.size - len(header))
+    (length,) = _HEADER.unpack(header)
+    request = json.loads(_recv_exact(conn, length))
+
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(request["cwd"])
+    # Forwardable variables come from the caller only; the rest of the
+    # daemon's own environment (PATH, HOME, ...) is kept
+    for key in _forwarded_env(os.environ):
+        del os.environ[key]
+    os.environ.update(_forwarded_env(request["env"]))
+    _rebind_pack_dirs()
+    sys.argv = ["agentzero", *request["argv"]]
+
+    code = _run_cli(request["argv"])
+    sys.stdout.flush()
+    sys.stderr.flush()
+    conn.sendall(_EXIT_CODE.pack(code))
+
+
+def try_connect(path: Path) -> bool:
+    """Return True if something is accepting connections on the socket at path."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        return False
+    finally:
+        sock.close()
+    return True
+
+
+def serve(path: Path | None = None) -> None:
+    """Preload the CLI and serve forked requests on a Unix socket until interrupted."""
+    path = path or socket_path()
+    if not hasattr(socket, "SO_PEERCRED"):
+        raise SystemExit("agentzero: daemon mode needs SO_PEERCRED (Linux)")
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _is_private_dir(path.parent):
+        raise SystemExit(
+            f"agentzero: {path.parent} must be a directory owned by you with mode 0700"
+        )
+    _preload()
+
+    if path.exists():
+        if try_connect(path):
+            raise SystemExit(f"agentzero: a daemon is already listening on {path}")
+        path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    # Children are never waited on; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"agentzero daemon listening on {path}", file=sys.stderr)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            if os.fork() == 0:
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                try:
+                    _handle(conn)
+                except BaseException:
+                    traceback.print_exc()
+                finally:
+                    os._exit(0)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
@@ -10,6 +10,7 @@ rows are found and the operation is replace, a new row is added.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 # list of dimension columns used to match rows; must appear in both
@@ -28,59 +29,169 @@ def _ensure_dim_cols(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def apply_patches(
-    assumptions: pd.DataFrame, policy: pd.DataFrame, patches: pd.DataFrame
-) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Apply scenario patches to the assumptions and policy tables.
+def _match_pairs(base: pd.DataFrame, run: pd.DataFrame) -> pd.DataFrame:
+    """Match every patch in a run against the base table.
 
-    Returns a tuple of (new_assumptions, new_policy). The input
-    dataframes are not modified; copies are created for updates.
+    Returns a frame of (_patch_pos, _base_pos) pairs, one per matching row,
+    where both are positions within run and base. Patches are grouped by
+    which dimensions they leave null, so each group is matched with a
+    single merge on its non-null dimensions.
     """
-    # Work on copies to avoid side effects
-    assumptions = _ensure_dim_cols(assumptions.copy())
-    policy = _ensure_dim_cols(policy.copy())
-    patches = _ensure_dim_cols(patches.copy())
-
-    for _, row in patches.iterrows():
-        target = row["target"]
-        op = row["operation"]
+    patch_keys = run[DIM_COLS].assign(_patch_pos=np.arange(len(run)))
+    base_keys = base[DIM_COLS].assign(_base_pos=np.arange(len(base)))
+    null_pattern = run[DIM_COLS].isna()
+
+    pairs = [pd.DataFrame({"_patch_pos": [], "_base_pos": []}, dtype="int64")]
+    for pattern, group in patch_keys.groupby([null_pattern[c] for c in DIM_COLS], sort=False):
+        on = [c for c, is_null in zip(DIM_COLS, pattern, strict=True) if not is_null]
+        if not on:
+            # a patch with no dimensions matches every row
+            pairs.append(group[["_patch_pos"]].merge(base_keys[["_base_pos"]], how="cross"))
+            continue
+        left = group[[*on, "_patch_pos"]]
+        right = base_keys[[*on, "_base_pos"]]
+        for c in on:
+            # e.g. float years in patches vs int years in the table
+            if left[c].dtype != right[c].dtype:
+                left = left.astype({c: object})
+                right = right.astype({c: object})
+        pairs.append(left.merge(right, on=on, how="inner")[["_patch_pos", "_base_pos"]])
+    return pd.concat(pairs, ignore_index=True)
+
+
+def _pending_matches(pending: list[dict], dims: dict) -> list[dict]:
+    """Return the not-yet-appended rows matching a patch's non-null dimensions."""
+    return [r for r in pending if all(pd.isna(v) or r.get(c) == v for c, v in dims.items())]
+
+
+def _apply_patch_rows(base: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """Apply patches to one table row by row, in order.
+
+    Rows added by unmatched replace patches are collected and concatenated
+    once at the end; later patches still see and update them.
+    """
+    pending: list[dict] = []
+    # Dimension columns are never modified here (new rows are only appended
+    # at the end), so compare against plain NumPy arrays to skip pandas'
+    # per-comparison Series overhead
+    dim_arrays = {c: base[c].to_numpy() for c in DIM_COLS}
+    mask = np.empty(len(base), dtype=bool)
+    # itertuples yields lightweight namedtuples rather than one Series per row
+    for row in rows.itertuples(index=False):
+        op = row.operation
+        dims = {c: getattr(row, c) for c in DIM_COLS}
         # Build a boolean mask for matching dimension values
-        base = assumptions if target == "assumptions" else policy
-        mask = pd.Series(True, index=base.index)
-        for c in DIM_COLS:
-            val = row[c]
+        mask.fill(True)
+        for c, val in dims.items():
             # skip NaN/None in patch
             if pd.isna(val):
                 continue
-            mask &= base[c] == val
+            np.logical_and(mask, dim_arrays[c] == val, out=mask)
         # Determine rows that match
-        matches = base[mask]
+        matches = base.index[mask]
+        new_matches = _pending_matches(pending, dims) if pending else []
         if op == "replace":
-            if not matches.empty:
+            if not matches.empty or new_matches:
                 # replace values in matching rows
-                base.loc[matches.index, "value"] = row["value"]
+                base.loc[matches, "value"] = row.value
+                for r in new_matches:
+                    r["value"] = row.value
             else:
-                # if no match, append a new row with dimension values and value
+                # if no match, queue a new row with dimension values and value
                 new_row = {
-                    **{c: row[c] for c in base.columns if c in DIM_COLS},
-                    "value": row["value"],
-                    "unit": row["unit"],
+                    **{c: dims[c] for c in base.columns if c in DIM_COLS},
+                    "value": row.value,
+                    "unit": row.unit,
                     # include param in assumptions and policy row if not None
-                    "param": row.get("param"),
+                    "param": dims["param"],
                 }
                 # ensure all columns present in the new row
                 for col in base.columns:
                     if col not in new_row:
                         new_row[col] = None
-                # concat rather than deprecated DataFrame.append
-                base = pd.concat([base, pd.DataFrame([new_row])], ignore_index=True)
+                pending.append(new_row)
         elif op == "scale":
-            base.loc[matches.index, "value"] = base.loc[matches.index, "value"] * row["value"]
+            base.loc[matches, "value"] = base.loc[matches, "value"] * row.value
+            for r in new_matches:
+                r["value"] = r["value"] * row.value
         elif op == "add":
-            base.loc[matches.index, "value"] = base.loc[matches.index, "value"] + row["value"]
-        # assign base back
-        if target == "assumptions":
-            assumptions = base
-        else:
-            policy = base
-    return assumptions, policy
+            base.loc[matches, "value"] = base.loc[matches, "value"] + row.value
+            for r in new_matches:
+                r["value"] = r["value"] + row.value
+    if pending:
+        # one concat rather than copying the table for every appended row
+        base = pd.concat([base, pd.DataFrame(pending)], ignore_index=True)
+    return base
+
+
+def _apply_run(base: pd.DataFrame, run: pd.DataFrame, op: str) -> pd.DataFrame:
+    """Apply a run of consecutive patches sharing one operation to a table.
+
+    All matches are found up front and applied with one vectorised update:
+    for replace the last matching patch wins; scale and add apply each
+    patch's factor or offset to its rows with unbuffered ufunc.at calls in
+    patch order, so the floating-point results are exactly those of applying
+    the patches one at a time. A replace run in which some patch matches
+    nothing would append rows that later patches in the run could match, so
+    it is applied row by row.
+    """
+    if op not in ("replace", "scale", "add"):
+        return base
+    pairs = _match_pairs(base, run)
+    if op == "replace" and pairs["_patch_pos"].nunique() < len(run):
+        return _apply_patch_rows(base, run)
+    if pairs.empty:
+        return base
+
+    pairs["patch_value"] = run["value"].to_numpy()[pairs["_patch_pos"].to_numpy()]
+    if op == "replace":
+        last = pairs.sort_values("_patch_pos").drop_duplicates("_base_pos", keep="last")
+        rows = base.index[last["_base_pos"].to_numpy()]
+        base.loc[rows, "value"] = last["patch_value"].to_numpy()
+        return base
+
+    # Stable sort keeps each row's updates in patch order
+    pairs = pairs.sort_values("_patch_pos", kind="stable")
+    base_pos = pairs["_base_pos"].to_numpy()
+    patch_values = pairs["patch_value"].to_numpy(dtype="float64")
+    values = base["value"].to_numpy(dtype="float64", copy=True)
+    ufunc = np.multiply if op == "scale" else np.add
+    ufunc.at(values, base_pos, patch_values)
+    positions = np.unique(base_pos)
+    base.loc[base.index[positions], "value"] = values[positions]
+    return base
+
+
+def apply_patches(
+    assumptions: pd.DataFrame, policy: pd.DataFrame, patches: pd.DataFrame | None
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Apply scenario patches to the assumptions and policy tables.
+
+    Returns a tuple of (new_assumptions, new_policy). The input
+    dataframes are not modified; copies are created for updates. With no
+    patches (None or an empty frame) both tables are only shallow-copied
+    to add any missing dimension columns.
+    """
+    if patches is None or patches.empty:
+        return (
+            _ensure_dim_cols(assumptions.copy(deep=False)),
+            _ensure_dim_cols(policy.copy(deep=False)),
+        )
+    # Only tables that some patch targets are deep-copied; adding the
+    # missing dimension columns to a shallow copy leaves the input intact
+    targets = set(patches["target"].unique())
+    tables = {
+        "assumptions": _ensure_dim_cols(assumptions.copy(deep="assumptions" in targets)),
+        "policy": _ensure_dim_cols(policy.copy(deep=bool(targets - {"assumptions"}))),
+    }
+    patches = _ensure_dim_cols(patches.copy(deep=False))
+
+    # Consecutive patches with the same target and operation form a run
+    # that can be applied in one vectorised step; runs apply in order
+    target = patches["target"]
+    op = patches["operation"]
+    run_ids = (target.ne(target.shift()) | op.ne(op.shift())).cumsum()
+    for _, run in patches.groupby(run_ids, sort=False):
+        key = "assumptions" if run["target"].iat[0] == "assumptions" else "policy"
+        tables[key] = _apply_run(tables[key], run, str(run["operation"].iat[0]))
+    return tables["assumptions"], tables["policy"]
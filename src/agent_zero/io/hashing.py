@@ -4,19 +4,55 @@ The run ID is a short hash computed from the engine version, the
 assumptions pack hash, the scenario pack hash, the list of years and
 the random seed. This ensures reproducibility and provides a unique
 directory name for results.
+
+Inputs are streamed into the hash as length-prefixed binary fields
+(strings as UTF-8, years packed as little-endian int64, the seed as a
+length-prefixed two's-complement integer of any size), so no intermediate
+payload structure or JSON document is built. The digest is BLAKE2b with
+a 6-byte output, which yields the 12 hex characters directly; the ID
+needs to be short and stable, not cryptographically strong.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+_INT64 = struct.Struct("<q")
+_LEN = struct.Struct("<I")
+# Length marker for a missing (None) string, distinct from the empty string
+_NONE_LEN = b"\xff\xff\xff\xff"
+# 6 bytes -> 12 hex characters
+_DIGEST_SIZE = 6
+
+
+def _update_str(h: hashlib.blake2b, value: str | None) -> None:
+    """Feed an optional string into the hash with a length prefix."""
+    if value is None:
+        h.update(_NONE_LEN)
+        return
+    data = value.encode("utf-8")
+    h.update(_LEN.pack(len(data)))
+    h.update(data)
+
+
+def _update_int(h: hashlib.blake2b, value: int) -> None:
+    """Feed an arbitrary-size integer into the hash with a length prefix."""
+    # One extra bit for the sign; at least one byte so 0 is not empty
+    data = value.to_bytes(value.bit_length() // 8 + 1, "little", signed=True)
+    h.update(_LEN.pack(len(data)))
+    h.update(data)
 
 
 def make_run_id(
     engine_version: str,
     assumptions_hash: str,
     scenario_hash: str | None,
-    years: list[int],
+    years: Sequence[int],
     seed: int,
     opts: dict | None = None,
 ) -> str:
@@ -30,8 +66,8 @@ def make_run_id(
         The hash of the baseline assumptions pack.
     scenario_hash : Optional[str]
         The hash of the scenario pack (or None for baseline only).
-    years : List[int]
-        The list of years included in the run.
+    years : Sequence[int]
+        The years included in the run (a list or a ``range``).
     seed : int
         A random seed (currently unused but part of the id).
     opts : Optional[dict]
@@ -40,17 +76,19 @@ def make_run_id(
     Returns
     -------
     str
-        A hexadecimal string truncated to 12 characters.
+        A 12-character hexadecimal string.
     """
-    payload = {
-        "engine_version": engine_version,
-        "assumptions_hash": assumptions_hash,
-        "scenario_hash": scenario_hash,
-        "years": years,
-        "seed": seed,
-        "opts": opts or {},
-    }
-    # JSON serialisation ensures stable ordering
-    serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
-    digest = hashlib.sha256(serialized).hexdigest()
-    return digest[:12]
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    _update_str(h, engine_version)
+    _update_str(h, assumptions_hash)
+    _update_str(h, scenario_hash)
+    # Pack all years in one C-level conversion instead of formatting each one
+    packed_years = array("q", years)
+    if sys.byteorder == "big":
+        packed_years.byteswap()
+    h.update(_INT64.pack(len(packed_years)))
+    h.update(packed_years.tobytes())
+    _update_int(h, seed)
+    # opts is reserved and normally empty; sorted JSON keeps it order-independent
+    _update_str(h, json.dumps(opts, sort_keys=True) if opts else "{}")
+    return h.hexdigest()
@@ -9,50 +9,144 @@ contain `scenario.yaml` and `patches.csv`.
 
 from __future__ import annotations
 
+import copy
+import csv
+import functools
+from collections.abc import Collection
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Columns of the assumptions and policy tables that the model and patch
+# application read; others (notes, sources, uncertainty bands) are only
+# needed when a full table is written out or validated
+MODEL_COLUMNS = frozenset(
+    {"region", "sector", "tech", "year", "param", "policy_type", "value", "unit"}
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; the stat fields in the key invalidate edited files."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file through the parse cache, returning a private copy."""
+    st = path.stat()
+    # deepcopy so callers may mutate the result without affecting the cache
+    return copy.deepcopy(_parse_yaml_file(str(path.resolve()), st.st_mtime_ns, st.st_size))
+
 
 def load_manifest(pack_dir: Path) -> dict:
-    """Load the manifest.yaml file from a pack directory."""
-    manifest_path = pack_dir / "manifest.yaml"
-    with open(manifest_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Load the manifest.yaml file from a pack directory.
+
+    Parses are cached per file and invalidated when its mtime or size
+    changes, so loading the same pack repeatedly only parses it once.
+    """
+    return _load_yaml(pack_dir / "manifest.yaml")
+
 
+def _read_csv(csv_path: Path, columns: Collection[str] | None = None) -> pd.DataFrame:
+    """Read a CSV file with pyarrow's multithreaded reader, falling back to pandas.
 
-def _read_table(path: Path) -> pd.DataFrame:
+    Empty fields become nulls and all-empty columns become float NaN
+    columns, matching what ``pd.read_csv`` produces for pack tables.
+    Columns Arrow would infer as dates, times or timestamps are kept as
+    their original strings, as pandas does. If `columns` is given, only
+    those of them present in the file are read.
+    """
+    usecols = None if columns is None else (lambda c: c in columns)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(csv_path, usecols=usecols)
+    include: list[str] = []
+    if columns is not None:
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), [])
+        include = [c for c in header if c in columns]
+
+    def read(column_types: dict | None = None) -> pa.Table:
+        return pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True, include_columns=include, column_types=column_types
+            ),
+        )
+
+    try:
+        table = read()
+        temporal = [f.name for f in table.schema if pa.types.is_temporal(f.type)]
+        if temporal:
+            # pandas leaves date-like text as strings; re-read those columns untyped
+            table = read(dict.fromkeys(temporal, pa.string()))
+    except pa.ArrowInvalid:
+        # e.g. ragged rows that pandas tolerates
+        return pd.read_csv(csv_path, usecols=usecols)
+    # pandas reads an all-empty column as float NaN rather than None
+    schema = pa.schema(
+        [f.with_type(pa.float64()) if pa.types.is_null(f.type) else f for f in table.schema]
+    )
+    return table.cast(schema).to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _read_table(path: Path, columns: Collection[str] | None = None) -> pd.DataFrame:
     """Read a table from a Parquet or CSV file.
 
     If the Parquet file does not exist, looks for a CSV file with the same
     stem. If the Parquet engine is not available the function also falls back
     to reading a CSV file. This allows the package to run in environments
     without optional dependencies such as pyarrow or fastparquet.
+
+    If `columns` is given, only those of them present in the file are read
+    (Parquet skips the other column chunks on disk); missing ones are
+    ignored rather than raising.
     """
     # If path doesn't exist, try CSV extension
     if not path.exists():
         csv_path = path.with_suffix(".csv")
         if csv_path.exists():
-            return pd.read_csv(csv_path)
+            return _read_csv(csv_path, columns)
     try:
-        return pd.read_parquet(path)
+        # Imported lazily; pyarrow directly skips pandas' engine dispatch, and
+        # self_destruct frees Arrow buffers as pandas takes them over
+        import pyarrow.parquet as pq
+
+        selected = None
+        if columns is not None:
+            selected = [c for c in pq.read_schema(path).names if c in columns]
+        table = pq.read_table(path, columns=selected, use_threads=True)
+        return table.to_pandas(self_destruct=True, split_blocks=True)
     except Exception:
         # fall back to CSV; expect header row
         csv_path = path.with_suffix(".csv")
-        return pd.read_csv(csv_path)
+        return _read_csv(csv_path, columns)
 
 
-def load_assumptions_pack(pack_dir: Path) -> dict:
+def load_assumptions_pack(pack_dir: Path, model_columns_only: bool = False) -> dict:
     """Load an assumptions pack from the given directory.
 
     Returns a dictionary with keys: manifest, assumptions, policy and dir.
+    With `model_columns_only`, only the columns in `MODEL_COLUMNS` are read
+    from the tables, which is enough to apply patches and simulate.
     """
     man = load_manifest(pack_dir)
     assumptions_file = pack_dir / "assumptions.parquet"
     policy_file = pack_dir / "policy.parquet"
-    assumptions = _read_table(assumptions_file)
-    policy = _read_table(policy_file)
+    columns = MODEL_COLUMNS if model_columns_only else None
+    assumptions = _read_table(assumptions_file, columns)
+    policy = _read_table(policy_file, columns)
     return {
         "manifest": man,
         "assumptions": assumptions,
@@ -67,9 +161,7 @@ def load_scenario_pack(pack_dir: Path) -> dict:
     Returns a dictionary with keys: manifest, scenario, patches and dir.
     """
     man = load_manifest(pack_dir)
-    scenario_file = pack_dir / "scenario.yaml"
-    with open(scenario_file, encoding="utf-8") as f:
-        scenario = yaml.safe_load(f)
+    scenario = _load_yaml(pack_dir / "scenario.yaml")
     patches_file = pack_dir / "patches.parquet"
     # fallback to CSV if parquet engine unavailable
     patches = _read_table(patches_file)
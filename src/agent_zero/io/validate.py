@@ -30,6 +30,11 @@ ALLOWED_PATCH_OPS = {"replace", "scale", "add"}
 ALLOWED_PATCH_TARGETS = {"assumptions", "policy"}
 
 
+def _has_missing(values: pd.Series) -> bool:
+    """Return True if any value is null, checked on the raw NumPy array."""
+    return bool(pd.isna(values.to_numpy()).any())
+
+
 def validate_assumptions_pack(pack: dict) -> list[str]:
     """Validate an assumptions pack.
 
@@ -46,9 +51,9 @@ def validate_assumptions_pack(pack: dict) -> list[str]:
     missing_policy_cols = REQ_POLICY_COLS - set(policy.columns)
     if missing_policy_cols:
         errs.append(f"policy missing columns: {missing_policy_cols}")
-    if assumptions["unit"].isna().any():
+    if _has_missing(assumptions["unit"]):
         errs.append("assumptions table has empty unit values")
-    if policy["unit"].isna().any():
+    if _has_missing(policy["unit"]):
         errs.append("policy table has empty unit values")
     return errs
 
@@ -64,12 +69,12 @@ def validate_scenario_pack(pack: dict) -> list[str]:
     missing_patch_cols = REQ_PATCH_COLS - set(patches.columns)
     if missing_patch_cols:
         errs.append(f"patches missing columns: {missing_patch_cols}")
-    bad_ops = set(patches["operation"]) - ALLOWED_PATCH_OPS
+    bad_ops = set(patches["operation"].unique()) - ALLOWED_PATCH_OPS
     if bad_ops:
         errs.append(f"patches contain invalid operations: {bad_ops}")
-    bad_targets = set(patches["target"]) - ALLOWED_PATCH_TARGETS
+    bad_targets = set(patches["target"].unique()) - ALLOWED_PATCH_TARGETS
     if bad_targets:
         errs.append(f"patches contain invalid targets: {bad_targets}")
-    if patches["unit"].isna().any():
+    if _has_missing(patches["unit"]):
         errs.append("patches table has empty unit values")
     return errs
@@ -14,43 +14,43 @@ import numpy as np
 import pandas as pd
 
 from ..utils.types import Action, AgentState, WorldState
+from .lookups import ASSUMPTION_KEYS, table_index
 
 
 def _lookup_param(
     assumptions: pd.DataFrame, tech: str, year: int, param: str, default: float
 ) -> float:
-    """Helper to lookup a parameter in the assumptions table using boolean indexing."""
-    mask = (
-        (assumptions["tech"] == tech)
-        & (assumptions["year"] == year)
-        & (assumptions["param"] == param)
-    )
-    if mask.any():
-        return float(assumptions.loc[mask, "value"].iloc[0])
-    return default
+    """Helper to lookup a parameter in the assumptions table via a cached index."""
+    return float(table_index(assumptions, ASSUMPTION_KEYS).get((tech, year, param), default))
 
 
-def _forecast_prices(current: float, trend_param: float, horizon: int) -> list[float]:
-    """Forecast future prices using a linear trend."""
-    return [current * (1 + trend_param * (y / horizon)) for y in range(1, horizon + 1)]
-
-
-def _compute_npv(
+def _forecast_npv(
+    current: float,
+    trend_param: float,
+    horizon: int,
     capex: float,
     opex: float,
-    price_forecast: list[float],
     emissions_intensity: float,
     carbon_price: float,
     discount_rate: float,
-) -> float:
-    """Compute the net present value for investing in one unit of capacity."""
+) -> tuple[float, float]:
+    """Forecast prices on a linear trend and value one unit of new capacity.
+
+    Returns (npv, expected_price), where npv is the net present value of
+    investing in one unit of capacity and expected_price is the mean of
+    the forecast prices over the horizon.
+    """
     npv = 0.0
-    for y, p in enumerate(price_forecast, start=1):
+    total = 0.0
+    for y in range(1, horizon + 1):
+        p = current * (1 + trend_param * (y / horizon))
+        total += p
         margin = p - opex - emissions_intensity * carbon_price
         npv += margin / ((1 + discount_rate) ** y)
     # subtract capex cost
     npv -= capex
-    return npv
+    expected_price = total / horizon if horizon > 0 else float("nan")
+    return npv, expected_price
 
 
 def decide(agent: AgentState, world: WorldState) -> Action:
@@ -80,9 +80,10 @@ def decide(agent: AgentState, world: WorldState) -> Action:
         invest_step = _lookup_param(assumptions, tech, t, "invest_step", 10.0)
 
         H = agent.horizon
-        # forecast future commodity price
-        price_forecast = _forecast_prices(prices[tech], trend, H)
-        npv = _compute_npv(capex, opex, price_forecast, ei, prices["carbon"], dr)
+        # forecast future commodity price and value new capacity against it
+        npv, expected_price = _forecast_npv(
+            prices[tech], trend, H, capex, opex, ei, prices["carbon"], dr
+        )
 
         invest_amt = 0.0
         if npv > invest_threshold and agent.capacity < maxcap:
@@ -90,7 +91,6 @@ def decide(agent: AgentState, world: WorldState) -> Action:
 
         supply_amt = agent.capacity  # supply equals existing capacity in v1
         emissions = supply_amt * ei
-        expected_price = float(np.mean(price_forecast))
         action_inputs = {
             "prices": dict(prices),
             "capacity": agent.capacity,
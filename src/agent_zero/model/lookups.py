@@ -0,0 +1,61 @@
+"""Cached key lookups on the assumptions and policy tables.
+
+The model repeatedly selects single rows from the same assumptions and
+policy frames (by tech/year/param or year/policy_type). Rather than
+building boolean masks over the whole table on every call, each frame
+gets a ``key tuple -> value`` dict built once and cached for as long as
+the frame is alive. Frames are treated as immutable for the duration of
+a run.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+import pandas as pd
+
+ASSUMPTION_KEYS = ("tech", "year", "param")
+POLICY_KEYS = ("year", "policy_type")
+
+# Indexes keyed by (id(frame), key columns) because DataFrames are unhashable;
+# entries are dropped when the frame is garbage collected.
+_INDEXES: dict[
+    tuple[int, tuple[str, ...]], tuple[weakref.ref[pd.DataFrame], dict[tuple[Any, ...], Any]]
+] = {}
+
+
+def table_index(frame: pd.DataFrame, keys: tuple[str, ...]) -> dict[tuple[Any, ...], Any]:
+    """Return the cached ``key tuple -> value`` index for a table.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        The table to index. Must have the ``keys`` columns and ``value``.
+    keys : tuple[str, ...]
+        Column names making up the lookup key, in key order.
+
+    Returns
+    -------
+    dict
+        Mapping from key tuples to the ``value`` of the first matching row,
+        matching boolean indexing followed by ``iloc[0]``.
+    """
+    cache_key = (id(frame), keys)
+    cached = _INDEXES.get(cache_key)
+    if cached is not None and cached[0]() is frame:
+        return cached[1]
+    columns = [frame[k].tolist() for k in keys]
+    index: dict[tuple[Any, ...], Any] = {}
+    keys_iter = zip(*columns, strict=True)
+    for key, value in zip(keys_iter, frame["value"].tolist(), strict=True):
+        index.setdefault(key, value)
+    _INDEXES[cache_key] = (weakref.ref(frame), index)
+    weakref.finalize(frame, _INDEXES.pop, cache_key, None)
+    return index
+
+
+def carbon_price(policy: pd.DataFrame, year: int) -> float | None:
+    """Return the carbon price for a year from the policy table, if set."""
+    value = table_index(policy, POLICY_KEYS).get((year, "carbon_price"))
+    return None if value is None else float(value)
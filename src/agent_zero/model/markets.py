@@ -8,6 +8,7 @@ policy table for the current year. All markets are independent in v1.
 from __future__ import annotations
 
 from ..utils.types import Action, WorldState
+from .lookups import carbon_price
 
 
 def clear_markets(world: WorldState, actions: list[Action]) -> WorldState:
@@ -20,11 +21,20 @@ def clear_markets(world: WorldState, actions: list[Action]) -> WorldState:
     """
     t = world.t
     prices = dict(world.prices)  # copy
-    demand = dict(world.demand)
+    # demand is not changed here; world states are never mutated in place, so
+    # the new state can share the mapping (step copies it before updating)
+    demand = world.demand
 
-    # Sum supplies for each commodity
-    supply_e = sum(a.supply.get("electricity", 0.0) for a in actions)
-    supply_h = sum(a.supply.get("hydrogen", 0.0) for a in actions)
+    # Sum supplies for each commodity and emissions in a single pass
+    supply_e = 0.0
+    supply_h = 0.0
+    total_emissions = 0.0
+    for a in actions:
+        supply = a.supply
+        if supply:
+            supply_e += supply.get("electricity", 0.0)
+            supply_h += supply.get("hydrogen", 0.0)
+        total_emissions += a.emissions
 
     # Price adjustment coefficients (arbitrary small numbers)
     k_e = 0.05
@@ -39,13 +49,9 @@ def clear_markets(world: WorldState, actions: list[Action]) -> WorldState:
     prices["hydrogen"] = max(0.0, prices["hydrogen"] + k_h * (-bal_h))
 
     # Carbon price from policy
-    # carbon price lookup without using query
-    mask = (world.policy["year"] == t) & (world.policy["policy_type"] == "carbon_price")
-    if mask.any():
-        prices["carbon"] = float(world.policy.loc[mask, "value"].iloc[0])
-
-    # Aggregate emissions
-    total_emissions = sum(a.emissions for a in actions)
+    carbon = carbon_price(world.policy, t)
+    if carbon is not None:
+        prices["carbon"] = carbon
 
     flows = {
         "electricity_supply": supply_e,
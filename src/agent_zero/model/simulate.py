@@ -8,11 +8,13 @@ a history list.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import replace
 from typing import Any
 
 from ..utils.types import Action, AgentState, WorldState
 from .decisions import decide
+from .lookups import ASSUMPTION_KEYS, table_index
 from .markets import clear_markets
 
 
@@ -53,33 +55,36 @@ def step(
     world2 = clear_markets(world, actions)
 
     # 3. Update agent capacities with their investments
+    # Built from the end so the first entry wins for a repeated id, as a
+    # linear search would
+    act_by_id = {a.agent_id: a for a in reversed(actions)}
     updated_agents: list[AgentState] = []
     for ag in agents:
-        act = next((x for x in actions if x.agent_id == ag.id), None)
+        act = act_by_id.get(ag.id)
         if act and ag.agent_type in ("ElectricityProducer", "HydrogenProducer"):
             tech = ag.tech or ""
             ag.capacity += act.invest.get(tech, 0.0)
         updated_agents.append(ag)
 
     # Capture state_after and attach to actions
+    agents_by_id = {a.id: a for a in reversed(updated_agents)}
     actions_with_traces: list[Action] = []
     for act in actions:
         state_before = states_before.get(act.agent_id)
-        agent_after = next((a for a in updated_agents if a.id == act.agent_id), None)
+        agent_after = agents_by_id.get(act.agent_id)
         state_after = _agent_to_dict(agent_after) if agent_after else None
         actions_with_traces.append(replace(act, state_before=state_before, state_after=state_after))
 
     # 4. Update demand for next year from assumptions, if specified
     t_next = world2.t + 1
-    demand = dict(world2.demand)
-    for commodity in ["electricity", "hydrogen"]:
-        mask = (
-            (world2.assumptions["year"] == t_next)
-            & (world2.assumptions["param"] == "demand")
-            & (world2.assumptions["tech"] == commodity)
-        )
-        if mask.any():
-            demand[commodity] = float(world2.assumptions.loc[mask, "value"].iloc[0])
+    param_index = table_index(world2.assumptions, ASSUMPTION_KEYS)
+    updates = {
+        commodity: float(value)
+        for commodity in ("electricity", "hydrogen")
+        if (value := param_index.get((commodity, t_next, "demand"))) is not None
+    }
+    # Only allocate a new mapping when some demand actually changes
+    demand = {**world2.demand, **updates} if updates else world2.demand
 
     # 5. Advance time
     world3 = WorldState(
@@ -96,9 +101,9 @@ def step(
 
 
 def simulate(
-    world0: WorldState, agents0: list[AgentState], years: list[int]
+    world0: WorldState, agents0: list[AgentState], years: Sequence[int]
 ) -> list[tuple[WorldState, list[AgentState], list[Action]]]:
-    """Run the simulation over a list of years.
+    """Run the simulation over a sequence of years (a list or a ``range``).
 
     Returns a history list where each element contains the world
     state after the step, the list of agent states and the actions taken.
@@ -10,6 +10,7 @@ import pandas as pd
 
 from ..utils.types import WorldState
 from .defaults import DEFAULT_DEMAND, DEFAULT_PRICES
+from .lookups import ASSUMPTION_KEYS, carbon_price, table_index
 
 
 def init_world(assumptions: pd.DataFrame, policy: pd.DataFrame, start_year: int) -> WorldState:
@@ -20,25 +21,20 @@ def init_world(assumptions: pd.DataFrame, policy: pd.DataFrame, start_year: int)
     the commodity and year. Other prices and demand use defaults.
     """
     # Carbon price lookup from policy
-    cp_mask = (policy["year"] == start_year) & (policy["policy_type"] == "carbon_price")
-    if cp_mask.any():
-        carbon = float(policy.loc[cp_mask, "value"].iloc[0])
-    else:
+    carbon = carbon_price(policy, start_year)
+    if carbon is None:
         carbon = DEFAULT_PRICES["carbon"]
     prices: dict[str, float] = dict(DEFAULT_PRICES)
     prices["carbon"] = carbon
 
     demand: dict[str, float] = dict(DEFAULT_DEMAND)
     # override demand from assumptions if provided
+    param_index = table_index(assumptions, ASSUMPTION_KEYS)
     for commodity in ["electricity", "hydrogen"]:
         # 'tech' column indicates the commodity in this toy model
-        mask = (
-            (assumptions["year"] == start_year)
-            & (assumptions["param"] == "demand")
-            & (assumptions["tech"] == commodity)
-        )
-        if mask.any():
-            demand[commodity] = float(assumptions.loc[mask, "value"].iloc[0])
+        value = param_index.get((commodity, start_year, "demand"))
+        if value is not None:
+            demand[commodity] = float(value)
 
     return WorldState(
         t=start_year,
@@ -13,16 +13,21 @@ Bundle structure:
     ├── assumptions_used.json  # Assumptions relevant to this run
     ├── scenario_diff.json     # Diff from baseline (if scenario run)
     ├── drivers.json           # Ranked factors driving results
-    └── downloads/             # Symlinks or copies of raw files
+    └── downloads/             # Hard links or copies of raw files
 """
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import logging
 import os
 import shutil
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yaml
@@ -30,11 +35,67 @@ import yaml
 from agent_zero import __version__ as ENGINE_VERSION
 from agent_zero.io.apply_patches import apply_patches
 from agent_zero.io.load_pack import load_assumptions_pack, load_scenario_pack
+from agent_zero.utils.paths import ASSUMPTIONS_PACKS_DIR, SCENARIO_PACKS_DIR, pack_stamp
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# agent_states columns read by _extract_agents and _extract_agent_traces
+AGENT_COLUMNS = frozenset(
+    {
+        "year",
+        "agent_id",
+        "agent_type",
+        "region",
+        "capacity",
+        "investment",
+        "expected_price",
+        "other_state_vars",
+        "action",
+        "action_inputs",
+        "state_before",
+        "state_after",
+    }
+)
+
+# Repetitive agent_states string columns, held as categoricals once read
+AGENT_CATEGORICAL_COLUMNS = frozenset({"agent_id", "agent_type", "region"})
+
+# Encoders are built once and shared by every _write_json call
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, default=str)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+
+# Items encoded per write when streaming a JSON array
+_JSON_ARRAY_CHUNK = 10_000
+
+# Threads used to read run manifests/summaries when rebuilding the runs index
+_INDEX_SCAN_WORKERS = 16
 
-def _safe_json_parse(value: str | dict | None, default: dict | None = None) -> dict:
+
+def _json_loads(value: str | bytes) -> Any:
+    """Parse a JSON document, with orjson when installed.
+
+    orjson rejects the NaN/Infinity tokens json.dumps writes for non-finite
+    floats, so documents it refuses are retried with the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+def _safe_json_parse(value: str | bytes | dict | None, default: dict | None = None) -> dict:
     """Safely parse a JSON string or return the value if already a dict."""
     if default is None:
         default = {}
@@ -43,7 +104,7 @@ def _safe_json_parse(value: str | dict | None, default: dict | None = None) -> d
     if isinstance(value, dict):
         return value
     try:
-        result = json.loads(value)
+        result = _json_loads(value)
         return result if result else default
     except (json.JSONDecodeError, TypeError):
         return default
@@ -52,7 +113,7 @@ def _safe_json_parse(value: str | dict | None, default: dict | None = None) -> d
 def _load_yaml(path: Path) -> dict:
     """Load a YAML file and return its contents as a dict."""
     with path.open(encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=SafeLoader) or {}
 
 
 def _load_json(path: Path) -> dict:
@@ -61,33 +122,101 @@ def _load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def _write_json(path: Path, data: object) -> None:
-    """Write data to a JSON file with indentation."""
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+def _encode_compact(data: object) -> bytes:
+    """Encode data as compact JSON bytes."""
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
 
+def _write_json(path: Path, data: object, *, pretty: bool = False) -> None:
+    """Write data to a JSON file.
 
-def _read_parquet_safe(path: Path) -> pd.DataFrame:
-    """Read a Parquet file, falling back to CSV if Parquet doesn't exist."""
+    Files read only by the frontend are written compactly; pretty=True
+    indents the output for files people are expected to open. Always uses
+    the shared stdlib encoders, never orjson, so a bundle is byte-identical
+    whether or not orjson is installed (orjson writes NaN as null, encodes
+    NumPy scalars that default=str would stringify, and formats small
+    floats differently). Bytes are written directly.
+    """
+    if pretty:
+        path.write_bytes(_PRETTY_ENCODER.encode(data).encode("utf-8"))
+    else:
+        path.write_bytes(_encode_compact(data))
+
+
+def _write_json_array(path: Path, items: Iterable[object]) -> None:
+    """Write items as a compact JSON array without materialising the list.
+
+    Items are encoded and written in chunks of _JSON_ARRAY_CHUNK, so only
+    one chunk and its bytes are held at a time. The output is identical to
+    _write_json on the equivalent list.
+    """
+    with path.open("wb") as f:
+        f.write(b"[")
+        separator = b""
+        for chunk in itertools.batched(items, _JSON_ARRAY_CHUNK):
+            f.write(separator)
+            f.write(b",".join(map(_encode_compact, chunk)))
+            separator = b","
+        f.write(b"]")
+
+
+def _read_parquet_safe(
+    path: Path, columns: Collection[str] | None = None, categorical: Collection[str] = ()
+) -> pd.DataFrame:
+    """Read a Parquet file, falling back to CSV if Parquet doesn't exist.
+
+    If `columns` is given, only those of them present in the file are read;
+    missing ones are ignored rather than raising. Columns named in
+    `categorical` are returned with the category dtype; from Parquet they
+    are decoded straight from the file's dictionary pages.
+    """
     if path.exists():
-        return pd.read_parquet(path)
+        if columns is None and not categorical:
+            return pd.read_parquet(path)
+        import pyarrow.parquet as pq
+
+        selected = [c for c in pq.read_schema(path).names if columns is None or c in columns]
+        dictionary = [c for c in selected if c in categorical]
+        return pd.read_parquet(path, columns=selected, read_dictionary=dictionary or None)
     csv_path = path.with_suffix(".csv")
     if csv_path.exists():
-        return pd.read_csv(csv_path)
+        return pd.read_csv(
+            csv_path,
+            usecols=None if columns is None else lambda c: c in columns,
+            dtype=dict.fromkeys(categorical, "category") or None,
+        )
     return pd.DataFrame()
 
 
+def _write_records_json(src: Path, dst: Path) -> None:
+    """Write a Parquet table (or its CSV fallback) as a JSON array of row objects.
+
+    Parquet rows are converted from Arrow one record batch at a time, with
+    nulls as None, and streamed through _write_json_array. Its encoders
+    write the shortest repr of each float, so values round-trip exactly.
+    """
+    rows: Iterable[dict]
+    if src.exists():
+        import pyarrow.parquet as pq
+
+        batches = pq.ParquetFile(src).iter_batches()
+        rows = itertools.chain.from_iterable(batch.to_pylist() for batch in batches)
+    elif src.with_suffix(".csv").exists():
+        rows = pd.read_csv(src.with_suffix(".csv")).to_dict(orient="records")
+    else:
+        rows = []
+    _write_json_array(dst, rows)
+
+
 def _build_reproduction_command(manifest: dict) -> str:
     """Build a CLI command to reproduce this run."""
-    parts = ["agentzero", "run"]
-
     assumptions = manifest.get("assumptions") or manifest.get("assumptions_manifest") or {}
     assum_id = assumptions.get("id") or assumptions.get("name", "baseline")
-    parts.extend(["--assum", assum_id])
+    cmd = f"agentzero run --assum {assum_id}"
 
     scenario = manifest.get("scenario") or manifest.get("scenario_manifest")
     if scenario and scenario.get("id"):
-        parts.extend(["--scen", scenario["id"]])
+        cmd += f" --scen {scenario['id']}"
 
     years = manifest.get("years", {})
     if isinstance(years, dict):
@@ -95,18 +224,15 @@ def _build_reproduction_command(manifest: dict) -> str:
         end = years.get("end")
         step = years.get("step", 1)
         if start and end:
-            if step == 1:
-                parts.extend(["--years", f"{start}:{end}"])
-            else:
-                parts.extend(["--years", f"{start}:{step}:{end}"])
+            cmd += f" --years {start}:{end}" if step == 1 else f" --years {start}:{step}:{end}"
     elif isinstance(years, list) and years:
-        parts.extend(["--years", ",".join(str(y) for y in sorted(years))])
+        cmd += f" --years {','.join(str(y) for y in sorted(years))}"
 
     seed = manifest.get("seed")
     if seed is not None:
-        parts.extend(["--seed", str(seed)])
+        cmd += f" --seed {seed}"
 
-    return " ".join(parts)
+    return cmd
 
 
 def _convert_manifest(manifest: dict, run_id: str) -> dict:
@@ -176,30 +302,46 @@ def _convert_manifest(manifest: dict, run_id: str) -> dict:
     return web_manifest
 
 
+def _column(df: pd.DataFrame, name: str, default: object = None) -> list:
+    """Return a column as a list of Python values, or `default` repeated if absent."""
+    if name in df.columns:
+        return df[name].tolist()
+    return [default] * len(df)
+
+
+def _json_column(df: pd.DataFrame, name: str) -> list[dict]:
+    """Decode a column of JSON strings into dicts, once per column."""
+    return [_safe_json_parse(v) for v in _column(df, name)]
+
+
 def _extract_agents(agent_df: pd.DataFrame) -> list[dict]:
     """Extract unique agent configurations from agent_states DataFrame."""
     if agent_df.empty:
         return []
 
-    agents: list[dict] = []
-    seen_ids: set[str] = set()
-
-    for _, row in agent_df.iterrows():
-        agent_id = row.get("agent_id", "")
-        if agent_id in seen_ids:
-            continue
-        seen_ids.add(agent_id)
-
-        other_vars = _safe_json_parse(row.get("other_state_vars"))
+    # The first row of each agent describes its initial configuration
+    if "agent_id" in agent_df.columns:
+        agent_df = agent_df.drop_duplicates("agent_id", keep="first")
+    else:
+        agent_df = agent_df.head(1)
 
+    agents: list[dict] = []
+    for agent_id, agent_type, region, capacity, other_vars in zip(
+        _column(agent_df, "agent_id", ""),
+        _column(agent_df, "agent_type", ""),
+        _column(agent_df, "region", ""),
+        _column(agent_df, "capacity", 0),
+        _json_column(agent_df, "other_state_vars"),
+        strict=True,
+    ):
         agents.append(
             {
                 "agent_id": agent_id,
-                "agent_type": row.get("agent_type", ""),
-                "region": row.get("region", ""),
+                "agent_type": agent_type,
+                "region": region,
                 "sector": other_vars.get("sector"),
                 "tech": other_vars.get("tech"),
-                "initial_capacity": float(row.get("capacity", 0)),
+                "initial_capacity": float(capacity),
                 "horizon": other_vars.get("horizon", 3),
                 "discount_rate": 0.07,
                 "decision_rule": "npv_threshold",
@@ -213,29 +355,50 @@ def _extract_agents(agent_df: pd.DataFrame) -> list[dict]:
 
 def _extract_agent_traces(agent_df: pd.DataFrame) -> list[dict]:
     """Extract decision traces from agent_states DataFrame."""
-    if agent_df.empty:
-        return []
+    return list(_iter_agent_traces(agent_df))
 
-    traces: list[dict] = []
 
-    for _, row in agent_df.iterrows():
-        action_inputs = _safe_json_parse(row.get("action_inputs"))
-        state_before = _safe_json_parse(row.get("state_before"))
-        state_after = _safe_json_parse(row.get("state_after"))
-        action_data = _safe_json_parse(row.get("action"))
+def _iter_agent_traces(agent_df: pd.DataFrame) -> Iterator[dict]:
+    """Yield decision traces from agent_states DataFrame one row at a time."""
+    if agent_df.empty:
+        return
 
+    # Columns are pulled out once rather than boxing every row into a
+    # Series; JSON cells are decoded as their row is reached, so only the
+    # traces being written are held at once
+    rows = zip(
+        _column(agent_df, "agent_id", ""),
+        _column(agent_df, "year", 0),
+        _column(agent_df, "expected_price"),
+        _column(agent_df, "capacity", 0.0),
+        _column(agent_df, "investment", 0),
+        map(_safe_json_parse, _column(agent_df, "action_inputs")),
+        map(_safe_json_parse, _column(agent_df, "state_before")),
+        map(_safe_json_parse, _column(agent_df, "state_after")),
+        map(_safe_json_parse, _column(agent_df, "action")),
+        strict=True,
+    )
+    for (
+        agent_id,
+        year,
+        expected_price,
+        capacity,
+        investment,
+        action_inputs,
+        state_before,
+        state_after,
+        action_data,
+    ) in rows:
         action = _determine_action(action_data)
 
-        traces.append(
+        yield (
             {
-                "agent_id": row.get("agent_id", ""),
-                "year": int(row.get("year", 0)),
+                "agent_id": agent_id,
+                "year": int(year),
                 "action": action,
                 "action_inputs": {
                     "current_price": action_inputs.get("current_price", 0.0),
-                    "expected_price": row.get("expected_price")
-                    if pd.notna(row.get("expected_price"))
-                    else None,
+                    "expected_price": expected_price if pd.notna(expected_price) else None,
                     "npv": action_inputs.get("npv"),
                     "capacity_headroom": action_inputs.get("capacity_headroom"),
                     "carbon_price": action_inputs.get("carbon_price", 0.0),
@@ -246,18 +409,16 @@ def _extract_agent_traces(agent_df: pd.DataFrame) -> list[dict]:
                     "vintage": state_before.get("vintage", 2024),
                 },
                 "state_after": {
-                    "capacity": state_after.get("capacity", row.get("capacity", 0.0)),
+                    "capacity": state_after.get("capacity", capacity),
                     "cash": state_after.get("cash", 0.0),
                     "vintage": state_after.get("vintage", 2024),
-                    "investment": float(row.get("investment", 0)),
+                    "investment": float(investment),
                     "supply": action_data.get("supply", {}),
                     "emissions": action_data.get("emissions", 0.0),
                 },
             }
         )
 
-    return traces
-
 
 def _determine_action(action_data: dict) -> str:
     """Determine the action type from action data."""
@@ -270,6 +431,59 @@ def _determine_action(action_data: dict) -> str:
     return "hold"
 
 
+def _assumption_rows(df: pd.DataFrame) -> list[dict]:
+    """Convert a resolved assumptions table into AssumptionRow dicts.
+
+    Whole columns are converted at once rather than checking every cell:
+    null (or absent) dimension and source values become None, and null
+    years, values and units become 0, 0.0 and "".
+    """
+    n = len(df)
+
+    def optional(col: str) -> list:
+        if col not in df.columns:
+            return [None] * n
+        return df[col].astype(object).where(df[col].notna(), None).tolist()
+
+    columns = {
+        "param": _column(df, "param"),
+        "region": optional("region"),
+        "sector": optional("sector"),
+        "tech": optional("tech"),
+        "year": df["year"].fillna(0).astype("int64").tolist() if "year" in df else [0] * n,
+        "value": df["value"].fillna(0.0).astype("float64").tolist() if "value" in df else [0.0] * n,
+        "unit": df["unit"].fillna("").tolist() if "unit" in df else [""] * n,
+        "source": optional("source"),
+    }
+    return [dict(zip(columns, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+
+
+@functools.lru_cache(maxsize=32)
+def _resolved_assumption_rows(
+    pack_dir: Path,
+    pack_stamp: tuple,
+    scen_dir: Path | None,
+    scen_stamp: tuple | None,
+) -> tuple[dict, ...]:
+    """Load a pack, apply an optional scenario and convert it to AssumptionRow dicts.
+
+    Cached per pack and scenario; the file stamps in the key make edited
+    packs load afresh. Runs exported together usually share their packs.
+    Load and patch errors propagate, so a failure is never cached.
+    """
+    ap = load_assumptions_pack(pack_dir)
+    assumptions_df = ap["assumptions"]
+    policy_df = ap["policy"]
+    if scen_dir is not None:
+        sp = load_scenario_pack(scen_dir)
+        assumptions_df, policy_df = apply_patches(assumptions_df, policy_df, sp["patches"])
+
+    if assumptions_df.empty:
+        return ()
+
+    return tuple(_assumption_rows(assumptions_df))
+
+
 def _load_assumptions_used(manifest: dict) -> list[dict]:
     """Resolve the assumptions used for this run into AssumptionRow dicts.
 
@@ -282,54 +496,54 @@ def _load_assumptions_used(manifest: dict) -> list[dict]:
         logger.warning("No assumptions ID found in manifest, skipping assumptions export")
         return []
 
-    pack_dir = Path("data") / "assumptions_packs" / assum_id
+    pack_dir = ASSUMPTIONS_PACKS_DIR / assum_id
     if not pack_dir.exists():
         logger.warning(f"Assumptions pack not found at {pack_dir}, skipping assumptions export")
         return []
 
-    try:
-        ap = load_assumptions_pack(pack_dir)
-        assumptions_df = ap["assumptions"]
-        policy_df = ap["policy"]
-    except Exception as e:
-        logger.warning(f"Failed to load assumptions pack {assum_id}: {e}")
-        return []
-
     scen_meta = manifest.get("scenario") or manifest.get("scenario_manifest") or {}
     scen_id = scen_meta.get("id")
-    if scen_id:
-        scen_dir = Path("data") / "scenario_packs" / scen_id
-        if scen_dir.exists():
-            try:
-                sp = load_scenario_pack(scen_dir)
-                assumptions_df, policy_df = apply_patches(assumptions_df, policy_df, sp["patches"])
-            except Exception as e:
-                logger.warning(f"Failed to apply scenario patches from {scen_id}: {e}")
-
-    if assumptions_df.empty:
-        return []
+    scen_dir = SCENARIO_PACKS_DIR / scen_id if scen_id else None
+    if scen_dir is not None and not scen_dir.exists():
+        scen_dir = None
 
-    rows: list[dict] = []
-    for _, row in assumptions_df.iterrows():
-        rows.append(
-            {
-                "param": row.get("param"),
-                "region": row.get("region") if pd.notna(row.get("region")) else None,
-                "sector": row.get("sector") if pd.notna(row.get("sector")) else None,
-                "tech": row.get("tech") if pd.notna(row.get("tech")) else None,
-                "year": int(row.get("year")) if pd.notna(row.get("year")) else 0,
-                "value": float(row.get("value")) if pd.notna(row.get("value")) else 0.0,
-                "unit": row.get("unit", "") or "",
-                "source": row.get("source")
-                if "source" in row and pd.notna(row.get("source"))
-                else None,
-            }
-        )
-
-    return rows
+    stamp = pack_stamp(pack_dir)
+    rows = None
+    if scen_dir is not None:
+        try:
+            rows = _resolved_assumption_rows(pack_dir, stamp, scen_dir, pack_stamp(scen_dir))
+        except Exception as e:
+            logger.warning(f"Failed to apply scenario patches from {scen_dir.name}: {e}")
+    if rows is None:
+        try:
+            rows = _resolved_assumption_rows(pack_dir, stamp, None, None)
+        except Exception as e:
+            logger.warning(f"Failed to load assumptions pack {pack_dir.name}: {e}")
+            return []
+    # Copies keep the cached rows safe from callers
+    return [dict(row) for row in rows]
+
+
+def _link_download(src: Path, dst: Path) -> None:
+    """Place a raw run file in the bundle's downloads directory.
+
+    A hard link is used where possible: it shares the file's data without
+    copying it and, unlike a symlink, survives the bundle being zipped or
+    moved. Across filesystems the file is copied (shutil uses in-kernel
+    copying where the platform offers it). Set AGENT_ZERO_WEB_SYMLINKS=1
+    to get symlinks instead.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        if os.environ.get("AGENT_ZERO_WEB_SYMLINKS") == "1":
+            os.symlink(src.resolve(), dst)
+        else:
+            os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 
-def export_web_bundle(run_dir: Path, out_dir: Path) -> None:
+def export_web_bundle(run_dir: Path, out_dir: Path, manifest: dict | None = None) -> None:
     """Export a run bundle to web-friendly JSON format.
 
     Parameters
@@ -339,6 +553,9 @@ def export_web_bundle(run_dir: Path, out_dir: Path) -> None:
         timeseries.parquet, agent_states.parquet, and summary.json.
     out_dir : Path
         Path to the output directory where web bundle will be written.
+    manifest : dict, optional
+        The already-parsed contents of run_dir/manifest.yaml. When given,
+        the manifest is not read again; it is not modified.
 
     Raises
     ------
@@ -348,50 +565,62 @@ def export_web_bundle(run_dir: Path, out_dir: Path) -> None:
     run_dir = Path(run_dir)
     out_dir = Path(out_dir)
 
-    manifest_path = run_dir / "manifest.yaml"
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"manifest.yaml not found in {run_dir}")
+    if manifest is None:
+        manifest_path = run_dir / "manifest.yaml"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"manifest.yaml not found in {run_dir}")
+        manifest = _load_yaml(manifest_path)
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    manifest = _load_yaml(manifest_path)
     run_id = manifest.get("run_id", run_dir.name)
 
-    web_manifest = _convert_manifest(manifest, run_id)
-    _write_json(out_dir / "manifest.json", web_manifest)
+    # Assemble every file first, then encode and write them concurrently;
+    # the manifest and summary are kept readable
+    writes: list[Callable[[], None]] = []
+
+    def add(name: str, data: object, pretty: bool = False) -> None:
+        writes.append(functools.partial(_write_json, out_dir / name, data, pretty=pretty))
+
+    add("manifest.json", _convert_manifest(manifest, run_id), pretty=True)
 
     summary_path = run_dir / "summary.json"
     if summary_path.exists():
-        summary = _load_json(summary_path)
-        _write_json(out_dir / "summary.json", summary)
+        add("summary.json", _load_json(summary_path), pretty=True)
     else:
-        _write_json(out_dir / "summary.json", {"run_id": run_id})
+        add("summary.json", {"run_id": run_id}, pretty=True)
 
-    ts_df = _read_parquet_safe(run_dir / "timeseries.parquet")
-    if not ts_df.empty:
-        timeseries = ts_df.to_dict(orient="records")
-        _write_json(out_dir / "timeseries.json", timeseries)
-    else:
-        _write_json(out_dir / "timeseries.json", [])
-
-    agent_df = _read_parquet_safe(run_dir / "agent_states.parquet")
-    agents = _extract_agents(agent_df)
-    _write_json(out_dir / "agents.json", agents)
-
-    agent_traces = _extract_agent_traces(agent_df)
-    _write_json(out_dir / "agent_traces.json", agent_traces)
+    writes.append(
+        functools.partial(
+            _write_records_json, run_dir / "timeseries.parquet", out_dir / "timeseries.json"
+        )
+    )
+
+    agent_df = _read_parquet_safe(
+        run_dir / "agent_states.parquet", AGENT_COLUMNS, AGENT_CATEGORICAL_COLUMNS
+    )
+    add("agents.json", _extract_agents(agent_df))
+    # One trace per agent-year: streamed rather than built as a list
+    writes.append(
+        functools.partial(
+            _write_json_array, out_dir / "agent_traces.json", _iter_agent_traces(agent_df)
+        )
+    )
 
-    assumptions_used = _load_assumptions_used(manifest)
-    _write_json(out_dir / "assumptions_used.json", assumptions_used)
+    add("assumptions_used.json", _load_assumptions_used(manifest))
 
     scenario = manifest.get("scenario") or manifest.get("scenario_manifest")
     if scenario and scenario.get("id"):
-        _write_json(out_dir / "scenario_diff.json", [])
+        add("scenario_diff.json", [])
 
     # drivers.json is intentionally empty until story generation populates it.
     # The frontend shows "No drivers data available. Run story generation to populate."
     # which is the expected UX for runs that haven't had story generation run.
-    _write_json(out_dir / "drivers.json", [])
+    add("drivers.json", [])
+
+    with ThreadPoolExecutor(max_workers=min(len(writes), os.cpu_count() or 1)) as pool:
+        # Consume the results so a failed write raises here
+        list(pool.map(lambda write: write(), writes))
 
     downloads_dir = out_dir / "downloads"
     downloads_dir.mkdir(exist_ok=True)
@@ -400,18 +629,81 @@ def export_web_bundle(run_dir: Path, out_dir: Path) -> None:
         src = run_dir / fname
         dst = downloads_dir / fname
         if src.exists():
-            try:
-                if dst.exists() or dst.is_symlink():
-                    dst.unlink()
-                os.symlink(src.resolve(), dst)
-            except OSError:
-                shutil.copy2(src, dst)
+            _link_download(src, dst)
+
+
+def _file_stamp(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+# Per-run fingerprints from the last index rebuild; dot-prefixed so they are
+# not published with the web bundle
+_INDEX_META = ".index.meta.json"
+_LEGACY_INDEX_META = "index.meta.json"
+
+
+def _load_index_meta(meta_path: Path) -> dict:
+    """Load the per-run fingerprints saved by the previous index rebuild."""
+    try:
+        meta = _load_json(meta_path)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _build_index_entry(run_path: Path, manifest_path: Path, summary_path: Path) -> dict | None:
+    """Build a runs index entry from an exported run's manifest and summary."""
+    try:
+        manifest = _load_json(manifest_path)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    quick_summary = {"cumulative_emissions": 0, "year_net_zero": None}
+    # A missing summary surfaces as OSError from the open, with no separate stat
+    try:
+        summary = _load_json(summary_path)
+        quick_summary = {
+            "cumulative_emissions": summary.get("cumulative_emissions", 0),
+            "year_net_zero": summary.get("year_net_zero"),
+        }
+    except (json.JSONDecodeError, OSError):
+        pass
+
+    scenario = manifest.get("scenario")
+    tags = []
+    if scenario:
+        tags.append("scenario")
+    else:
+        tags.append("baseline")
+
+    return {
+        "run_id": manifest.get("run_id", run_path.name),
+        "created_at": manifest.get("created_at", ""),
+        "years": manifest.get("years", {"start": 2024, "end": 2050}),
+        "assumptions_id": manifest.get("assumptions", {}).get("id", "unknown"),
+        "scenario_id": scenario.get("id") if scenario else None,
+        "engine_version": manifest.get("engine_version", "0.1.0"),
+        "quick_summary": quick_summary,
+        "tags": tags,
+    }
 
 
 def rebuild_web_index(web_dir: Path) -> None:
     """Rebuild runs/index.json from all exported runs.
 
     Scans web_dir/runs/*/manifest.json and creates web_dir/runs/index.json.
+    The (mtime, size) of each run's manifest.json and summary.json is saved
+    with its entry in runs/.index.meta.json, and runs whose files are
+    unchanged since the previous rebuild reuse that entry instead of being
+    parsed again. A missing or unreadable meta file means a full rebuild.
+    The meta file is build state, not a web asset: it is dot-prefixed so
+    static hosting and dot-excluding copies skip it, and a legacy
+    runs/index.meta.json from older rebuilds is removed.
 
     Parameters
     ----------
@@ -419,7 +711,6 @@ def rebuild_web_index(web_dir: Path) -> None:
         Path to the web directory containing runs/.
     """
     web_dir = Path(web_dir)
-    runs_dir = web_dir / "runs" if web_dir.name != "runs" else web_dir
 
     if web_dir.name == "runs":
         runs_dir = web_dir
@@ -427,57 +718,51 @@ def rebuild_web_index(web_dir: Path) -> None:
     else:
         runs_dir = web_dir / "runs"
         index_path = runs_dir / "index.json"
+    meta_path = index_path.with_name(_INDEX_META)
 
     if not runs_dir.exists():
         _write_json(index_path, [])
         return
 
-    entries: list[dict] = []
+    previous = _load_index_meta(meta_path)
 
-    for run_path in sorted(runs_dir.iterdir()):
-        if not run_path.is_dir():
-            continue
+    def scan(run_path: Path) -> tuple[list, dict] | None:
         manifest_path = run_path / "manifest.json"
-        if not manifest_path.exists():
-            continue
-
-        try:
-            manifest = _load_json(manifest_path)
-        except (json.JSONDecodeError, OSError):
-            continue
-
         summary_path = run_path / "summary.json"
-        quick_summary = {"cumulative_emissions": 0, "year_net_zero": None}
-        if summary_path.exists():
-            try:
-                summary = _load_json(summary_path)
-                quick_summary = {
-                    "cumulative_emissions": summary.get("cumulative_emissions", 0),
-                    "year_net_zero": summary.get("year_net_zero"),
-                }
-            except (json.JSONDecodeError, OSError):
-                pass
-
-        scenario = manifest.get("scenario")
-        tags = []
-        if scenario:
-            tags.append("scenario")
-        else:
-            tags.append("baseline")
-
-        entries.append(
-            {
-                "run_id": manifest.get("run_id", run_path.name),
-                "created_at": manifest.get("created_at", ""),
-                "years": manifest.get("years", {"start": 2024, "end": 2050}),
-                "assumptions_id": manifest.get("assumptions", {}).get("id", "unknown"),
-                "scenario_id": scenario.get("id") if scenario else None,
-                "engine_version": manifest.get("engine_version", "0.1.0"),
-                "quick_summary": quick_summary,
-                "tags": tags,
-            }
-        )
+        manifest_stamp = _file_stamp(manifest_path)
+        if manifest_stamp is None:
+            return None
+        stamp = [manifest_stamp, _file_stamp(summary_path)]
+
+        cached = previous.get(run_path.name)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == stamp:
+            return stamp, cached[1]
+        entry = _build_index_entry(run_path, manifest_path, summary_path)
+        if entry is None:
+            return None
+        return stamp, entry
+
+    # DirEntry.is_dir() answers from the directory listing itself; only
+    # symlinked entries need a stat
+    with os.scandir(runs_dir) as it:
+        run_paths = [
+            Path(e.path)
+            for e in sorted(it, key=lambda e: e.name)
+            if e.is_dir() and not e.name.startswith(".")
+        ]
+    meta: dict[str, list] = {}
+    entries: list[dict] = []
+    # Per-run scans are mostly stat/read syscalls, so threads overlap them well
+    with ThreadPoolExecutor(max_workers=_INDEX_SCAN_WORKERS) as pool:
+        for run_path, result in zip(run_paths, pool.map(scan, run_paths), strict=True):
+            if result is None:
+                continue
+            stamp, entry = result
+            meta[run_path.name] = [stamp, entry]
+            entries.append(entry)
 
     entries.sort(key=lambda e: e.get("created_at", ""), reverse=True)
 
     _write_json(index_path, entries)
+    _write_json(meta_path, meta)
+    index_path.with_name(_LEGACY_INDEX_META).unlink(missing_ok=True)
@@ -10,9 +10,12 @@ A results bundle consists of:
 from __future__ import annotations
 
 import json
+import os
+from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -20,6 +23,16 @@ from agent_zero import __version__ as ENGINE_VERSION
 
 from ..utils.types import Action, AgentState, WorldState
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
+try:
+    import fcntl
+except ImportError:  # Windows; index updates are not locked
+    fcntl = None  # type: ignore[assignment]
+
 UNITS = {
     "timeseries": {
         "year": None,
@@ -46,6 +59,49 @@ UNITS = {
     },
 }
 
+# Arrow type aliases for each results table column, so the Parquet schema is
+# fixed up front rather than inferred from the column values
+COLUMN_TYPES = {
+    "timeseries": {
+        "year": "int64",
+        "region": "string",
+        "commodity": "string",
+        "price": "double",
+        "demand": "double",
+        "supply": "double",
+        "emissions": "double",
+        "scenario_id": "string",
+        "assumptions_id": "string",
+        "run_id": "string",
+    },
+    "agent_states": {
+        "year": "int64",
+        "agent_id": "string",
+        "agent_type": "string",
+        "region": "string",
+        "capacity": "double",
+        "investment": "double",
+        "expected_price": "double",
+        "other_state_vars": "string",
+        "action": "string",
+        "action_inputs": "string",
+        "state_before": "string",
+        "state_after": "string",
+    },
+}
+
+
+def _to_json(obj: object) -> str:
+    """Serialise one agent-state payload to a JSON string.
+
+    Always uses the stdlib encoder with its default settings, so the same
+    run yields byte-identical bundles whether or not orjson is installed
+    (orjson formats small floats and non-finite values differently, and
+    its float formatting has changed between releases). Non-finite floats
+    are written as NaN/Infinity, which the web exporter's parser accepts.
+    """
+    return json.dumps(obj)
+
 
 def _extract_pack_ref(manifest: dict | None) -> dict | None:
     """Extract id, hash, version from a manifest for lineage tracking."""
@@ -58,6 +114,83 @@ def _extract_pack_ref(manifest: dict | None) -> dict | None:
     }
 
 
+RUNS_INDEX = "index.json"
+# Run manifest fields recorded in the runs index for `agentzero runs`
+_INDEX_FIELDS = ("years", "assumptions", "scenario")
+
+
+def update_runs_index(out_base: Path, run_manifest: dict) -> None:
+    """Record a run's listing fields in out_base/index.json.
+
+    The index maps run_id to the subset of the run manifest shown by the
+    runs listing, so the listing can read one JSON file instead of parsing
+    every manifest.yaml. Each entry also records the ``[mtime_ns, size]``
+    of the run's manifest.yaml under ``manifest_stat``, so the listing can
+    tell when a manifest was edited after it was indexed.
+
+    The read-modify-write is done under an exclusive lock on
+    ``index.json.lock`` so concurrent runs do not drop each other's
+    entries, and the file is replaced atomically. An unreadable index is
+    started afresh.
+
+    Parameters
+    ----------
+    out_base : Path
+        The directory containing the run subdirectories.
+    run_manifest : dict
+        The manifest written to the run's manifest.yaml.
+    """
+    run_id = run_manifest["run_id"]
+    st = (out_base / run_id / "manifest.yaml").stat()
+    entry = {k: run_manifest.get(k) for k in _INDEX_FIELDS}
+    entry["manifest_stat"] = [st.st_mtime_ns, st.st_size]
+
+    index_path = out_base / RUNS_INDEX
+    with open(index_path.with_name(f"{index_path.name}.lock"), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            index = json.loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            index = {}
+        if not isinstance(index, dict):
+            index = {}
+
+        index[run_id] = entry
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+
+
+def _write_table(columns: dict, types: dict, df: pd.DataFrame, path: Path) -> None:
+    """Write a results table to Parquet, falling back to CSV.
+
+    The Arrow table is built straight from the column arrays with the
+    explicit column types, so string columns are not scanned for type
+    inference and an all-missing column (e.g. scenario_id without a
+    scenario) still gets a string type. It is written with ZSTD
+    compression and dictionary encoding. Column statistics are
+    skipped since nothing filters on them. If the Parquet write fails, the
+    DataFrame is written as CSV next to it instead.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema({name: pa.type_for_alias(t) for name, t in types.items()})
+        pq.write_table(
+            pa.Table.from_pydict(columns, schema=schema),
+            path,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            write_statistics=False,
+        )
+    except Exception:
+        path.unlink(missing_ok=True)
+        df.to_csv(path.with_suffix(".csv"), index=False)
+
+
 def write_run_bundle(
     out_base: Path,
     run_id: str,
@@ -91,49 +224,86 @@ def write_run_bundle(
         The path to the run directory.
     """
     run_dir = out_base / run_id
-    run_dir.mkdir(parents=True, exist_ok=True)
 
     created_ts = datetime.now(UTC).isoformat()
 
-    timeseries_rows: list[dict[str, float | int | str | None]] = []
-    agent_rows = []
-    # iterate over history and collect rows
-    for world, agents, actions in history:
+    scenario_manifest = manifests.get("scenario")
+    scenario_id = scenario_manifest.get("id") if scenario_manifest else None
+    assumptions_id = manifests.get("assumptions", {}).get("id")
+
+    # Per-step layout: the regions present and the traded commodities
+    # (excluding "carbon" - it's a policy param, not traded). Knowing the
+    # row counts up front lets every column be allocated once. Regions are
+    # sorted so row order does not depend on string hash seeding.
+    layouts = []
+    for world, agents, _ in history:
+        regions = sorted({ag.region for ag in agents})
+        commodities = [c for c in world.prices if c != "carbon"]
+        layouts.append((regions, commodities))
+    n_ts = sum(len(regions) * len(commodities) for regions, commodities in layouts)
+    n_ag = sum(len(agents) for _, agents, _ in history)
+
+    ts_year = np.empty(n_ts, dtype=np.int64)
+    ts_region: list[str | None] = [None] * n_ts
+    ts_commodity: list[str | None] = [None] * n_ts
+    ts_price = np.empty(n_ts, dtype=np.float64)
+    ts_demand = np.empty(n_ts, dtype=np.float64)
+    ts_supply = np.empty(n_ts, dtype=np.float64)
+    ts_emissions = np.empty(n_ts, dtype=np.float64)
+
+    ag_year = np.empty(n_ag, dtype=np.int64)
+    ag_id: list[str | None] = [None] * n_ag
+    ag_type: list[str | None] = [None] * n_ag
+    ag_region: list[str | None] = [None] * n_ag
+    ag_capacity = np.empty(n_ag, dtype=np.float64)
+    ag_investment = np.empty(n_ag, dtype=np.float64)
+    ag_expected_price = np.empty(n_ag, dtype=np.float64)
+    ag_other_state_vars: list[str | None] = [None] * n_ag
+    ag_action: list[str | None] = [None] * n_ag
+    ag_action_inputs: list[str | None] = [None] * n_ag
+    ag_state_before: list[str | None] = [None] * n_ag
+    ag_state_after: list[str | None] = [None] * n_ag
+
+    emissions_by_yr: dict[tuple[int, str], float] = {}
+
+    # iterate over history and fill the columns
+    i = j = 0
+    for (world, agents, actions), (regions, commodities) in zip(history, layouts, strict=True):
         t = world.t
         # Build supply per (region, commodity) from Action.supply dicts
-        supply_by_rc: dict[tuple[str, str], float] = {}
+        supply_by_rc: defaultdict[tuple[str, str], float] = defaultdict(float)
         for ag, act in zip(agents, actions, strict=True):
+            region = ag.region
             for commodity, amt in act.supply.items():
-                key = (ag.region, commodity)
-                supply_by_rc[key] = supply_by_rc.get(key, 0.0) + amt
-
-        # Get commodities (excluding "carbon" - it's a policy param, not traded)
-        commodities = [c for c in world.prices if c != "carbon"]
-        regions = {ag.region for ag in agents}
+                supply_by_rc[region, commodity] += amt
 
         # Emit one row per (region, commodity) - long format
+        n = len(regions) * len(commodities)
+        if n:
+            # Emissions repeat on every commodity row; keep one per (year, region)
+            for region in regions:
+                emissions_by_yr.setdefault((t, region), world.emissions)
+        ts_year[i : i + n] = t
+        ts_emissions[i : i + n] = world.emissions
         for region in regions:
             for commodity in commodities:
-                timeseries_rows.append(
-                    {
-                        "year": t,
-                        "region": region,
-                        "commodity": commodity,
-                        "price": world.prices[commodity],
-                        "demand": world.demand.get(commodity, 0.0),
-                        "supply": supply_by_rc.get((region, commodity), 0.0),
-                        "emissions": world.emissions,
-                        "scenario_id": manifests.get("scenario", {}).get("id")
-                        if manifests.get("scenario")
-                        else None,
-                        "assumptions_id": manifests.get("assumptions", {}).get("id"),
-                        "run_id": run_id,
-                    }
-                )
+                ts_region[i] = region
+                ts_commodity[i] = commodity
+                ts_price[i] = world.prices[commodity]
+                ts_demand[i] = world.demand.get(commodity, 0.0)
+                ts_supply[i] = supply_by_rc.get((region, commodity), 0.0)
+                i += 1
+
         # agent rows: capacity etc.
+        ag_year[j : j + len(agents)] = t
         for ag, act in zip(agents, actions, strict=True):
-            total_investment = sum(act.invest.values())
-            other_state_vars = json.dumps(
+            ag_id[j] = ag.id
+            ag_type[j] = ag.agent_type
+            ag_region[j] = ag.region
+            ag_capacity[j] = ag.capacity
+            ag_investment[j] = sum(act.invest.values())
+            ag_expected_price[j] = np.nan if act.expected_price is None else act.expected_price
+            ag_other_state_vars[j] = _to_json(
                 {
                     "sector": ag.sector,
                     "tech": ag.tech,
@@ -143,7 +313,7 @@ def write_run_bundle(
                     "params": ag.params,
                 }
             )
-            action_summary = json.dumps(
+            ag_action[j] = _to_json(
                 {
                     "supply": act.supply,
                     "invest": act.invest,
@@ -151,55 +321,55 @@ def write_run_bundle(
                     "emissions": act.emissions,
                 }
             )
-            action_inputs_json = json.dumps(act.action_inputs) if act.action_inputs else None
-            state_before_json = json.dumps(act.state_before) if act.state_before else None
-            state_after_json = json.dumps(act.state_after) if act.state_after else None
-            agent_rows.append(
-                {
-                    "year": t,
-                    "agent_id": ag.id,
-                    "agent_type": ag.agent_type,
-                    "region": ag.region,
-                    "capacity": ag.capacity,
-                    "investment": total_investment,
-                    "expected_price": act.expected_price,
-                    "other_state_vars": other_state_vars,
-                    "action": action_summary,
-                    "action_inputs": action_inputs_json,
-                    "state_before": state_before_json,
-                    "state_after": state_after_json,
-                }
-            )
+            ag_action_inputs[j] = _to_json(act.action_inputs) if act.action_inputs else None
+            ag_state_before[j] = _to_json(act.state_before) if act.state_before else None
+            ag_state_after[j] = _to_json(act.state_after) if act.state_after else None
+            j += 1
 
-    ts_df = pd.DataFrame(timeseries_rows)
-    ag_df = pd.DataFrame(agent_rows)
+    ts_columns = {
+        "year": ts_year,
+        "region": ts_region,
+        "commodity": ts_commodity,
+        "price": ts_price,
+        "demand": ts_demand,
+        "supply": ts_supply,
+        "emissions": ts_emissions,
+        "scenario_id": [scenario_id] * n_ts,
+        "assumptions_id": [assumptions_id] * n_ts,
+        "run_id": [run_id] * n_ts,
+    }
+    ag_columns = {
+        "year": ag_year,
+        "agent_id": ag_id,
+        "agent_type": ag_type,
+        "region": ag_region,
+        "capacity": ag_capacity,
+        "investment": ag_investment,
+        "expected_price": ag_expected_price,
+        "other_state_vars": ag_other_state_vars,
+        "action": ag_action,
+        "action_inputs": ag_action_inputs,
+        "state_before": ag_state_before,
+        "state_after": ag_state_after,
+    }
+    ts_df = pd.DataFrame(ts_columns)
+    ag_df = pd.DataFrame(ag_columns)
 
-    # Write Parquet if supported; fall back to CSV when parquet engines are unavailable
-    ts_path = run_dir / "timeseries.parquet"
-    ag_path = run_dir / "agent_states.parquet"
-    try:
-        ts_df.to_parquet(ts_path, index=False)
-    except Exception:
-        # use CSV fallback
-        ts_path = run_dir / "timeseries.csv"
-        ts_df.to_csv(ts_path, index=False)
-    try:
-        ag_df.to_parquet(ag_path, index=False)
-    except Exception:
-        ag_path = run_dir / "agent_states.csv"
-        ag_df.to_csv(ag_path, index=False)
-
-    # Compute summary metrics
-    # Emissions are repeated per commodity row, so deduplicate by (year, region)
-    if not ts_df.empty:
-        emissions_by_yr = ts_df.groupby(["year", "region"])["emissions"].first()
-        cumulative_emissions = float(emissions_by_yr.sum())
-        peak_emissions = float(emissions_by_yr.max())
-        if not emissions_by_yr.empty:
-            min_emissions_idx = emissions_by_yr.idxmin()
-            year_net_zero: int | None = int(min_emissions_idx[0])  # type: ignore[index]
-        else:
-            year_net_zero = None
+    # Create the run directory only once there is something to write, so a
+    # failure while assembling the tables leaves no empty run behind
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    _write_table(ts_columns, COLUMN_TYPES["timeseries"], ts_df, run_dir / "timeseries.parquet")
+    _write_table(ag_columns, COLUMN_TYPES["agent_states"], ag_df, run_dir / "agent_states.parquet")
+
+    # Compute summary metrics from the per-(year, region) emissions gathered
+    # above; ties for the minimum go to the earliest year
+    if emissions_by_yr:
+        keys = sorted(emissions_by_yr)
+        emissions = np.array([emissions_by_yr[k] for k in keys])
+        cumulative_emissions = float(emissions.sum())
+        peak_emissions = float(emissions.max())
+        year_net_zero: int | None = int(keys[int(emissions.argmin())][0])
     else:
         cumulative_emissions = 0.0
         peak_emissions = 0.0
@@ -228,16 +398,26 @@ def write_run_bundle(
         security: dict[str, dict[str, float]] = {}
         if df.empty:
             return security
-        for commodity in df["commodity"].unique():
-            cdf = df[df["commodity"] == commodity]
-            yearly = cdf.groupby("year").agg({"supply": "sum", "demand": "sum"})
-            shortage_years = (yearly["supply"] < yearly["demand"]).sum()
-            shortage_freq = float(shortage_years / len(yearly)) if len(yearly) > 0 else 0.0
-            ratios = yearly["supply"] / yearly["demand"].replace(0, float("inf"))
-            min_ratio = float(ratios.min()) if not ratios.empty else 1.0
+        # Sum supply and demand into a (commodity, year) grid with bincount
+        # over factorized codes; factorize keeps first-seen commodity order
+        comm_codes, commodities = pd.factorize(df["commodity"])
+        year_codes, year_levels = pd.factorize(df["year"])
+        n_comm, n_years = len(commodities), len(year_levels)
+        cells = comm_codes * n_years + year_codes
+        shape = (n_comm, n_years)
+        present = np.bincount(cells, minlength=n_comm * n_years).reshape(shape) > 0
+        supply = np.bincount(cells, df["supply"].to_numpy(float), n_comm * n_years).reshape(shape)
+        demand = np.bincount(cells, df["demand"].to_numpy(float), n_comm * n_years).reshape(shape)
+
+        shortage_freq = (present & (supply < demand)).sum(axis=1) / present.sum(axis=1)
+        ratio = supply / np.where(demand == 0, np.inf, demand)
+        min_ratio = np.where(present, ratio, np.inf).min(axis=1)
+        for commodity, freq, min_r in zip(
+            commodities.tolist(), shortage_freq.tolist(), min_ratio.tolist(), strict=True
+        ):
             security[commodity] = {
-                "shortage_frequency": shortage_freq,
-                "min_supply_demand_ratio": min_ratio,
+                "shortage_frequency": float(freq),
+                "min_supply_demand_ratio": float(min_r),
             }
         return security
 
@@ -281,6 +461,7 @@ def write_run_bundle(
         "cli_command": cli_command,
     }
     with open(run_dir / "manifest.yaml", "w", encoding="utf-8") as f:
-        yaml.safe_dump(run_manifest, f)
+        yaml.dump(run_manifest, f, Dumper=SafeDumper)
+    update_runs_index(out_base, run_manifest)
 
     return run_dir
@@ -7,6 +7,7 @@ against the results.schema.json specification.
 from __future__ import annotations
 
 import json
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
@@ -14,6 +15,11 @@ from typing import Any, Literal
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 @dataclass
 class ValidationIssue:
@@ -34,7 +40,10 @@ def _load_schema() -> dict[str, Any]:
 def _check_dtype(value: Any, expected_type: str) -> bool:
     """Check if a value matches the expected type string."""
     if expected_type == "int":
-        return isinstance(value, (int, float)) and (isinstance(value, int) or value == int(value))
+        # Integral floats (e.g. 2025.0) count; NaN and inf are not integers
+        if isinstance(value, float):
+            return value.is_integer()
+        return isinstance(value, int) and not isinstance(value, bool)
     elif expected_type == "float":
         return isinstance(value, (int, float))
     elif expected_type == "str":
@@ -54,32 +63,70 @@ def _check_dtype(value: Any, expected_type: str) -> bool:
     return True
 
 
-def validate_timeseries(df: pd.DataFrame, schema: dict[str, Any]) -> list[ValidationIssue]:
-    """Validate timeseries DataFrame against schema."""
-    issues: list[ValidationIssue] = []
-    ts_schema = schema.get("timeseries", {})
-    required_cols = ts_schema.get("required_columns", {})
-    constraints = ts_schema.get("constraints", {})
+def _missing_columns(table: str, columns: Collection[str], section: dict) -> list[ValidationIssue]:
+    """Report the section's required columns that are absent from a table."""
+    return [
+        ValidationIssue("error", f"{table}.{col}", f"Missing required column: {col}")
+        for col in section.get("required_columns", {})
+        if col not in columns
+    ]
 
-    for col in required_cols:
-        if col not in df.columns:
-            issues.append(
-                ValidationIssue("error", f"timeseries.{col}", f"Missing required column: {col}")
-            )
 
-    for col, constraint in constraints.items():
-        if col in df.columns and "min" in constraint:
+def _below_minimum(table: str, minima: dict[str, Any], section: dict) -> list[ValidationIssue]:
+    """Report constrained columns whose smallest value is below the allowed minimum.
+
+    ``minima`` maps column names to their smallest value (None or NaN when
+    the column has no values); columns absent from it are skipped.
+    """
+    issues: list[ValidationIssue] = []
+    for col, constraint in section.get("constraints", {}).items():
+        if col in minima and "min" in constraint:
             min_val = constraint["min"]
-            if (df[col] < min_val).any():
+            if minima[col] is not None and minima[col] < min_val:
                 issues.append(
                     ValidationIssue(
                         "error",
-                        f"timeseries.{col}",
+                        f"{table}.{col}",
                         f"Values below minimum {min_val} found",
                     )
                 )
+    return issues
+
+
+def _checked_columns(section: dict, *extra: str) -> list[str]:
+    """Return the columns whose values (rather than presence) are validated."""
+    return [*section.get("constraints", {}), *extra]
+
+
+def _frame_minima(df: pd.DataFrame, columns: Iterable[str]) -> dict[str, Any]:
+    """Return the smallest value of each of the given columns present in df."""
+    return {col: df[col].min() for col in columns if col in df.columns}
+
+
+def _parquet_minima(path: Path, columns: Iterable[str]) -> tuple[list[str], dict[str, Any]]:
+    """Return a Parquet file's column names and the minima of the given columns.
+
+    Only the requested columns are read, and their minima are computed by
+    Arrow, so the remaining (mostly string) columns are never loaded.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    names = pq.read_schema(path).names
+    table = pq.read_table(path, columns=[col for col in dict.fromkeys(columns) if col in names])
+    return names, {col: pc.min(table[col]).as_py() for col in table.column_names}
+
+
+def _validate_timeseries(
+    columns: Collection[str], minima: dict[str, Any], schema: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Validate timeseries column names and per-column minima against schema."""
+    ts_schema = schema.get("timeseries", {})
+    issues = _missing_columns("timeseries", columns, ts_schema)
+    issues.extend(_below_minimum("timeseries", minima, ts_schema))
 
-    if "emissions" in df.columns and (df["emissions"] < 0).any():
+    emissions_min = minima.get("emissions")
+    if emissions_min is not None and emissions_min < 0:
         issues.append(
             ValidationIssue(
                 "warning",
@@ -91,32 +138,26 @@ def validate_timeseries(df: pd.DataFrame, schema: dict[str, Any]) -> list[Valida
     return issues
 
 
-def validate_agent_states(df: pd.DataFrame, schema: dict[str, Any]) -> list[ValidationIssue]:
-    """Validate agent_states DataFrame against schema."""
-    issues: list[ValidationIssue] = []
+def _validate_agent_states(
+    columns: Collection[str], minima: dict[str, Any], schema: dict[str, Any]
+) -> list[ValidationIssue]:
+    """Validate agent_states column names and per-column minima against schema."""
     as_schema = schema.get("agent_states", {})
-    required_cols = as_schema.get("required_columns", {})
-    constraints = as_schema.get("constraints", {})
+    issues = _missing_columns("agent_states", columns, as_schema)
+    issues.extend(_below_minimum("agent_states", minima, as_schema))
+    return issues
 
-    for col in required_cols:
-        if col not in df.columns:
-            issues.append(
-                ValidationIssue("error", f"agent_states.{col}", f"Missing required column: {col}")
-            )
 
-    for col, constraint in constraints.items():
-        if col in df.columns and "min" in constraint:
-            min_val = constraint["min"]
-            if (df[col] < min_val).any():
-                issues.append(
-                    ValidationIssue(
-                        "error",
-                        f"agent_states.{col}",
-                        f"Values below minimum {min_val} found",
-                    )
-                )
+def validate_timeseries(df: pd.DataFrame, schema: dict[str, Any]) -> list[ValidationIssue]:
+    """Validate timeseries DataFrame against schema."""
+    checked = _checked_columns(schema.get("timeseries", {}), "emissions")
+    return _validate_timeseries(df.columns, _frame_minima(df, checked), schema)
 
-    return issues
+
+def validate_agent_states(df: pd.DataFrame, schema: dict[str, Any]) -> list[ValidationIssue]:
+    """Validate agent_states DataFrame against schema."""
+    checked = _checked_columns(schema.get("agent_states", {}))
+    return _validate_agent_states(df.columns, _frame_minima(df, checked), schema)
 
 
 def validate_summary(summary: dict[str, Any], schema: dict[str, Any]) -> list[ValidationIssue]:
@@ -170,11 +211,13 @@ def validate_bundle(run_dir: Path) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
     schema = _load_schema()
 
+    # Parquet tables are checked from their schema and the minima of the
+    # constrained columns, without loading the other columns
     ts_path = run_dir / "timeseries.parquet"
     ts_csv = run_dir / "timeseries.csv"
     if ts_path.exists():
-        ts_df = pd.read_parquet(ts_path)
-        issues.extend(validate_timeseries(ts_df, schema))
+        checked = _checked_columns(schema.get("timeseries", {}), "emissions")
+        issues.extend(_validate_timeseries(*_parquet_minima(ts_path, checked), schema))
     elif ts_csv.exists():
         ts_df = pd.read_csv(ts_csv)
         issues.extend(validate_timeseries(ts_df, schema))
@@ -186,8 +229,8 @@ def validate_bundle(run_dir: Path) -> list[ValidationIssue]:
     as_path = run_dir / "agent_states.parquet"
     as_csv = run_dir / "agent_states.csv"
     if as_path.exists():
-        as_df = pd.read_parquet(as_path)
-        issues.extend(validate_agent_states(as_df, schema))
+        checked = _checked_columns(schema.get("agent_states", {}))
+        issues.extend(_validate_agent_states(*_parquet_minima(as_path, checked), schema))
     elif as_csv.exists():
         as_df = pd.read_csv(as_csv)
         issues.extend(validate_agent_states(as_df, schema))
@@ -211,7 +254,7 @@ def validate_bundle(run_dir: Path) -> list[ValidationIssue]:
     manifest_path = run_dir / "manifest.yaml"
     if manifest_path.exists():
         with open(manifest_path, encoding="utf-8") as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=SafeLoader)
         issues.extend(validate_manifest(manifest, schema))
     else:
         issues.append(ValidationIssue("error", "manifest", "No manifest.yaml found"))
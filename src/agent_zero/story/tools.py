@@ -31,6 +31,12 @@ from agent_zero.story.types import (
     YearRange,
 )
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
 DEFAULT_MODEL_LIMITATIONS = [
     "Model results are projections based on simplified representations of complex systems",
     "Agent behaviour is based on stylized decision rules, not actual market participants",
@@ -72,7 +78,7 @@ def _load_yaml(path: Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
     with path.open() as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def _load_manifest(run_dir: Path) -> dict[str, Any] | None:
@@ -0,0 +1,38 @@
+"""Default locations of the input data packs.
+
+Packs are looked up by name under these directories, relative to the
+working directory unless overridden with the `AGENT_ZERO_ASSUM_DIR` and
+`AGENT_ZERO_SCEN_DIR` environment variables (e.g. to point CI batches at
+a pre-staged copy of the packs).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def pack_dirs() -> tuple[Path, Path]:
+    """Return the (assumptions, scenario) pack directories for the current environment."""
+    return (
+        Path(os.environ.get("AGENT_ZERO_ASSUM_DIR", "data/assumptions_packs")),
+        Path(os.environ.get("AGENT_ZERO_SCEN_DIR", "data/scenario_packs")),
+    )
+
+
+ASSUMPTIONS_PACKS_DIR, SCENARIO_PACKS_DIR = pack_dirs()
+
+
+def pack_stamp(pack_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Describe a pack directory by the sorted (name, mtime_ns, size) of each file.
+
+    Only stat calls are made, so callers can tell whether a pack changed
+    without parsing its manifest or loading any tables.
+    """
+    stamp = []
+    with os.scandir(pack_dir) as it:
+        for e in it:
+            if e.is_file():
+                st = e.stat()
+                stamp.append((e.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(stamp))
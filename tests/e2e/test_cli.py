@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import json
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from click.testing import CliRunner
 
+from agent_zero import __version__
 from agent_zero.cli import main
 
 
@@ -21,6 +27,24 @@ def test_cli_help() -> None:
     assert "runs" in result.output
 
 
+@pytest.mark.e2e
+def test_version_fast_path_skips_cli_import(repo_root: Path) -> None:
+    """Verify --version answers without importing the click CLI module."""
+    code = (
+        "import sys; from agent_zero.__main__ import main; "
+        "sys.argv = ['agentzero', '--version']; main(); "
+        "print('agent_zero.cli' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=repo_root / "src",
+    )
+    assert result.stdout.splitlines() == [f"agentzero, version {__version__}", "False"]
+
+
 @pytest.mark.e2e
 def test_validate_command_assumptions_pack(data_dir: Path) -> None:
     """Validate the baseline-v1 assumptions pack."""
@@ -49,3 +73,218 @@ def test_runs_command_no_runs(repo_root: Path) -> None:
         result = runner.invoke(main, ["runs"])
         assert result.exit_code == 0
         assert "No runs directory found" in result.output
+
+
+@pytest.mark.e2e
+def test_runs_command_lists_run_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the runs list command shows run directories and skips plain files."""
+    monkeypatch.chdir(tmp_path)
+    runs_dir = tmp_path / "runs"
+    (runs_dir / "bbb222").mkdir(parents=True)
+    (runs_dir / "aaa111").mkdir()
+    (runs_dir / "aaa111" / "manifest.yaml").write_text(
+        "years: {start: 2025, end: 2030}\nassumptions: {name: baseline-v1}\nscenario: {}\n"
+    )
+    (runs_dir / "notes.txt").write_text("not a run")
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["runs"])
+    assert result.exit_code == 0
+    assert result.output.index("aaa111") < result.output.index("bbb222")
+    assert "baseline-v1" in result.output
+    assert "notes.txt" not in result.output
+
+
+@pytest.mark.e2e
+def test_runs_command_prefers_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Indexed runs are listed from runs/index.json; other runs fall back to manifest.yaml."""
+    monkeypatch.chdir(tmp_path)
+    runs_dir = tmp_path / "runs"
+    (runs_dir / "aaa111").mkdir(parents=True)
+    manifest_path = runs_dir / "aaa111" / "manifest.yaml"
+    manifest_path.write_text("assumptions: {id: from-yaml}\n")
+    st = manifest_path.stat()
+    index = {
+        "aaa111": {
+            "years": [2025, 2030],
+            "assumptions": {"id": "from-index"},
+            "manifest_stat": [st.st_mtime_ns, st.st_size],
+        }
+    }
+    (runs_dir / "index.json").write_text(json.dumps(index))
+    (runs_dir / "bbb222").mkdir()
+    (runs_dir / "bbb222" / "manifest.yaml").write_text("assumptions: {id: unindexed}\n")
+
+    result = CliRunner().invoke(main, ["runs"])
+    assert result.exit_code == 0
+    assert "from-index" in result.output
+    assert "from-yaml" not in result.output
+    assert "2025–2030" in result.output
+    assert "unindexed" in result.output
+
+
+@pytest.mark.e2e
+def test_runs_command_reparses_edited_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A manifest edited in place after indexing is re-read, even if the index is newer."""
+    monkeypatch.chdir(tmp_path)
+    run_dir = tmp_path / "runs" / "aaa111"
+    run_dir.mkdir(parents=True)
+    manifest_path = run_dir / "manifest.yaml"
+    manifest_path.write_text("assumptions: {id: old-id}\n")
+    st = manifest_path.stat()
+    index = {
+        "aaa111": {"assumptions": {"id": "old-id"}, "manifest_stat": [st.st_mtime_ns, st.st_size]}
+    }
+    (tmp_path / "runs" / "index.json").write_text(json.dumps(index))
+    manifest_path.write_text("assumptions: {id: edited-id}\n")
+
+    result = CliRunner().invoke(main, ["runs"])
+    assert result.exit_code == 0
+    assert "edited-id" in result.output
+    assert "old-id" not in result.output
+
+
+@pytest.mark.e2e
+@pytest.mark.parametrize("out_format", ["parquet", "feather"])
+def test_build_command_writes_resolved_table(
+    repo_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, out_format: str
+) -> None:
+    """Build the baseline-v1 pack with a scenario in each output format."""
+    monkeypatch.chdir(repo_root)
+    out = tmp_path / f"resolved.{out_format}"
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        [
+            "build",
+            "--assum",
+            "baseline-v1",
+            "--scen",
+            "fast-elec-v1",
+            "--format",
+            out_format,
+            "--out",
+            str(out),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    reader = pd.read_feather if out_format == "feather" else pd.read_parquet
+    resolved = reader(out)
+    assert {"region", "year", "param", "value"} <= set(resolved.columns)
+    assert not resolved.empty
+
+
+@pytest.mark.e2e
+def test_validate_inputs_batch(data_dir: Path) -> None:
+    """Validate several packs in one invocation."""
+    runner = CliRunner()
+    packs = [
+        str(data_dir / "assumptions_packs" / "baseline-v1"),
+        str(data_dir / "scenario_packs" / "fast-elec-v1"),
+    ]
+    result = runner.invoke(main, ["validate-inputs", *packs])
+    assert result.exit_code == 0, result.output
+    assert "All 2 packs are valid" in result.output
+
+
+@pytest.mark.e2e
+def test_validate_inputs_batch_reports_failures(data_dir: Path, tmp_path: Path) -> None:
+    """A batch with an invalid pack exits 1 and names the failing pack."""
+    bad_pack = tmp_path / "bad-pack"
+    bad_pack.mkdir()
+    (bad_pack / "manifest.yaml").write_text('id: "bad"\ntype: "unknown"\n')
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["validate-inputs", str(data_dir / "assumptions_packs" / "baseline-v1"), str(bad_pack)],
+    )
+    assert result.exit_code == 1
+    assert "Unknown pack type 'unknown'" in result.output
+    assert "1 of 2 pack(s) failed validation" in result.output
+
+
+@pytest.mark.e2e
+def test_build_command_skips_when_up_to_date(
+    test_data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A repeated build is skipped until an input pack file changes."""
+    packs = tmp_path / "assumptions_packs"
+    shutil.copytree(test_data_dir / "assumptions_packs", packs)
+    monkeypatch.setattr("agent_zero.cli.ASSUMPTIONS_PACKS_DIR", packs)
+    out = tmp_path / "resolved.parquet"
+    args = ["build", "--assum", "tiny-baseline", "--out", str(out)]
+    runner = CliRunner()
+
+    first = runner.invoke(main, args)
+    assert first.exit_code == 0, first.output
+    assert "Wrote resolved assumptions" in first.output
+
+    second = runner.invoke(main, args)
+    assert second.exit_code == 0
+    assert "up to date" in second.output
+
+    forced = runner.invoke(main, [*args, "--force"])
+    assert "Wrote resolved assumptions" in forced.output
+
+    with (packs / "tiny-baseline" / "policy.csv").open("a") as f:
+        f.write("\n")
+    rebuilt = runner.invoke(main, args)
+    assert "Wrote resolved assumptions" in rebuilt.output
+
+
+@pytest.mark.e2e
+def test_export_web_all_in_parallel(
+    test_data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export several runs across worker processes, then skip them on a repeat."""
+    monkeypatch.setattr("agent_zero.cli.ASSUMPTIONS_PACKS_DIR", test_data_dir / "assumptions_packs")
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    for years in ("2025:2027", "2025:2028"):
+        result = runner.invoke(main, ["run", "--assum", "tiny-baseline", "--years", years])
+        assert result.exit_code == 0, result.output
+    run_ids = sorted(p.name for p in (tmp_path / "runs").iterdir() if p.is_dir())
+    assert len(run_ids) == 2
+
+    args = ["export-web", "--all", "--jobs", "2", "--no-index", "--out", "web"]
+    result = runner.invoke(main, args)
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 run(s)" in result.output
+    for run_id in run_ids:
+        assert (tmp_path / "web" / "runs" / run_id / "manifest.json").exists()
+
+    repeat = runner.invoke(main, args)
+    assert repeat.exit_code == 0
+    assert "Skipped 2 already-exported run(s)" in repeat.output
+
+
+@pytest.mark.e2e
+def test_validate_inputs_all(test_data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """--all validates every pack in the assumptions and scenario pack directories."""
+    monkeypatch.setattr("agent_zero.cli.ASSUMPTIONS_PACKS_DIR", test_data_dir / "assumptions_packs")
+    monkeypatch.setattr("agent_zero.cli.SCENARIO_PACKS_DIR", test_data_dir / "scenario_packs")
+    result = CliRunner().invoke(main, ["validate-inputs", "--all"])
+    assert result.exit_code == 0, result.output
+    assert "tiny-baseline" in result.output
+    assert "tiny-scenario" in result.output
+    assert "All 2 packs are valid" in result.output
+
+
+@pytest.mark.e2e
+def test_validate_inputs_requires_a_pack() -> None:
+    """Without pack paths or --all the command is a usage error."""
+    result = CliRunner().invoke(main, ["validate-inputs"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.e2e
+def test_no_command_prints_cached_welcome_screen() -> None:
+    """The bare command prints the banner and workflow help, identically on repeat calls."""
+    runner = CliRunner()
+    first = runner.invoke(main, [])
+    second = runner.invoke(main, [])
+    assert first.exit_code == 0
+    assert "TYPICAL WORKFLOW" in first.output
+    assert second.output == first.output
@@ -0,0 +1,142 @@
+"""Integration tests for the opt-in CLI daemon."""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from agent_zero.daemon import _forwarded_env, _rebind_pack_dirs
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not hasattr(os, "fork"), reason="daemon mode requires fork"),
+]
+
+_PROXY = (
+    "import sys; from agent_zero.daemon import try_proxy; "
+    "code = try_proxy(sys.argv[1:]); sys.exit(99 if code is None else code)"
+)
+
+
+@pytest.fixture
+def daemon_env(tmp_path: Path, repo_root: Path) -> Iterator[dict[str, str]]:
+    """Start a daemon on a private socket and yield the client environment."""
+    runtime_dir = tmp_path / "xdg"
+    runtime_dir.mkdir()
+    env = {
+        **os.environ,
+        "XDG_RUNTIME_DIR": str(runtime_dir),
+        "PYTHONPATH": str(repo_root / "src"),
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "agent_zero", "--daemon"],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    sock = runtime_dir / "agent_zero" / "daemon.sock"
+    deadline = time.monotonic() + 60
+    while not sock.exists():
+        if proc.poll() is not None or time.monotonic() > deadline:
+            proc.kill()
+            pytest.fail("daemon did not start")
+        time.sleep(0.05)
+    try:
+        yield env
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_command_runs_in_daemon(daemon_env: dict[str, str], tmp_path: Path) -> None:
+    """A proxied command runs in the caller's cwd and writes to the caller's stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROXY, "runs"],
+        env=daemon_env,
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0
+    assert "No runs directory found" in result.stdout
+
+
+def test_exit_code_is_forwarded(daemon_env: dict[str, str], tmp_path: Path) -> None:
+    """A failing command's exit code is returned to the client."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROXY, "export-web", "--all"],
+        env=daemon_env,
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 1
+    assert "No runs directory found" in result.stdout
+
+
+def test_no_daemon_falls_back(tmp_path: Path, repo_root: Path) -> None:
+    """Without a listening daemon, try_proxy reports None."""
+    env = {**os.environ, "XDG_RUNTIME_DIR": str(tmp_path), "PYTHONPATH": str(repo_root / "src")}
+    result = subprocess.run(
+        [sys.executable, "-c", _PROXY, "runs"], env=env, capture_output=True, timeout=60
+    )
+    assert result.returncode == 99
+
+
+def test_socket_in_shared_dir_is_not_trusted(tmp_path: Path, repo_root: Path) -> None:
+    """A socket in a directory others can access is never connected to."""
+    sock_dir = tmp_path / "agent_zero"
+    sock_dir.mkdir(mode=0o755)
+    sock_dir.chmod(0o755)
+    env = {**os.environ, "XDG_RUNTIME_DIR": str(tmp_path), "PYTHONPATH": str(repo_root / "src")}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(sock_dir / "daemon.sock"))
+        listener.listen()
+        result = subprocess.run(
+            [sys.executable, "-c", _PROXY, "runs"], env=env, capture_output=True, timeout=30
+        )
+    assert result.returncode == 99
+
+
+def test_only_cli_environment_is_forwarded() -> None:
+    env = {
+        "AGENT_ZERO_ASSUM_DIR": "packs",
+        "ANTHROPIC_API_KEY": "key",
+        "TERM": "xterm",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+        "PATH": "/usr/bin",
+    }
+    assert _forwarded_env(env) == {
+        "AGENT_ZERO_ASSUM_DIR": "packs",
+        "ANTHROPIC_API_KEY": "key",
+        "TERM": "xterm",
+    }
+
+
+def test_pack_dirs_follow_caller_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Pack directories bound at import time are re-resolved for each request."""
+    from agent_zero import cli
+    from agent_zero.post import export_web
+    from agent_zero.utils import paths
+
+    for module in (cli, export_web, paths):
+        monkeypatch.setattr(module, "ASSUMPTIONS_PACKS_DIR", module.ASSUMPTIONS_PACKS_DIR)
+        monkeypatch.setattr(module, "SCENARIO_PACKS_DIR", module.SCENARIO_PACKS_DIR)
+    monkeypatch.setenv("AGENT_ZERO_ASSUM_DIR", str(tmp_path / "assum"))
+    monkeypatch.setenv("AGENT_ZERO_SCEN_DIR", str(tmp_path / "scen"))
+
+    _rebind_pack_dirs()
+
+    for module in (cli, export_web, paths):
+        assert tmp_path / "assum" == module.ASSUMPTIONS_PACKS_DIR
+        assert tmp_path / "scen" == module.SCENARIO_PACKS_DIR
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import importlib
 import json
+import math
+import shutil
+import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 import yaml
 
+from agent_zero.post import export_web
 from agent_zero.post.export_web import (
+    _assumption_rows,
     _build_reproduction_command,
     _convert_manifest,
     _determine_action,
     _extract_agent_traces,
     _extract_agents,
+    _read_parquet_safe,
+    _safe_json_parse,
     export_web_bundle,
     rebuild_web_index,
 )
@@ -243,6 +252,24 @@ def sample_run_dir(tmp_path: Path, sample_manifest: dict) -> Path:
     return run_dir
 
 
+class TestSafeJsonParse:
+    """Tests for _safe_json_parse."""
+
+    def test_parses_str_and_bytes(self) -> None:
+        assert _safe_json_parse('{"npv": 1.5}') == {"npv": 1.5}
+        assert _safe_json_parse(b'{"npv": 1.5}') == {"npv": 1.5}
+
+    def test_non_finite_floats(self) -> None:
+        result = _safe_json_parse(json.dumps({"npv": float("nan"), "cap": 1.0}))
+        assert math.isnan(result["npv"])
+        assert result["cap"] == 1.0
+
+    def test_invalid_or_empty_returns_default(self) -> None:
+        assert _safe_json_parse("not json") == {}
+        assert _safe_json_parse(None, {"x": 1}) == {"x": 1}
+        assert _safe_json_parse("{}", {"x": 1}) == {"x": 1}
+
+
 class TestBuildReproductionCommand:
     """Tests for _build_reproduction_command."""
 
@@ -424,6 +451,63 @@ class TestDetermineAction:
         assert _determine_action(action_data) == "invest"
 
 
+class TestAssumptionRows:
+    """Tests for _assumption_rows."""
+
+    def test_nulls_and_missing_columns(self) -> None:
+        df = pd.DataFrame(
+            {
+                "param": ["capex", "opex"],
+                "region": ["AUS", None],
+                "tech": ["solar", "wind"],
+                "year": [2025.0, None],
+                "value": [100.0, None],
+                "unit": ["USD/kW", None],
+            }
+        )
+
+        rows = _assumption_rows(df)
+
+        assert rows[0] == {
+            "param": "capex",
+            "region": "AUS",
+            "sector": None,
+            "tech": "solar",
+            "year": 2025,
+            "value": 100.0,
+            "unit": "USD/kW",
+            "source": None,
+        }
+        assert rows[1]["region"] is None
+        assert rows[1]["year"] == 0
+        assert rows[1]["value"] == 0.0
+        assert rows[1]["unit"] == ""
+
+
+class TestReadParquetSafe:
+    """Tests for _read_parquet_safe."""
+
+    def test_columns_prune_and_ignore_missing(self, tmp_path: Path) -> None:
+        df = pd.DataFrame({"agent_id": ["A"], "capacity": [1.0], "extra": ["x"]})
+        df.to_parquet(tmp_path / "agents.parquet", index=False)
+        df.to_csv(tmp_path / "fallback.csv", index=False)
+
+        for name in ("agents.parquet", "fallback.parquet"):
+            out = _read_parquet_safe(tmp_path / name, {"agent_id", "capacity", "year"})
+            assert sorted(out.columns) == ["agent_id", "capacity"]
+
+    def test_categorical_columns(self, tmp_path: Path) -> None:
+        df = pd.DataFrame({"agent_id": ["A", "A", "B"], "capacity": [1.0, 2.0, 3.0]})
+        df.to_parquet(tmp_path / "agents.parquet", index=False)
+        df.to_csv(tmp_path / "fallback.csv", index=False)
+
+        for name in ("agents.parquet", "fallback.parquet"):
+            out = _read_parquet_safe(tmp_path / name, categorical={"agent_id"})
+            assert isinstance(out["agent_id"].dtype, pd.CategoricalDtype)
+            assert out["agent_id"].tolist() == ["A", "A", "B"]
+            assert out["capacity"].tolist() == [1.0, 2.0, 3.0]
+
+
 class TestExportWebBundle:
     """Tests for export_web_bundle."""
 
@@ -441,6 +525,15 @@ class TestExportWebBundle:
             manifest = json.load(f)
         assert manifest["run_id"] == "test-run-123"
 
+    def test_uses_preparsed_manifest(self, sample_run_dir: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "web_output"
+        (sample_run_dir / "manifest.yaml").unlink()
+        export_web_bundle(sample_run_dir, out_dir, manifest={"run_id": "preparsed-run"})
+
+        with (out_dir / "manifest.json").open() as f:
+            manifest = json.load(f)
+        assert manifest["run_id"] == "preparsed-run"
+
     def test_creates_summary_json(self, sample_run_dir: Path, tmp_path: Path) -> None:
         out_dir = tmp_path / "web_output"
         export_web_bundle(sample_run_dir, out_dir)
@@ -456,6 +549,28 @@ class TestExportWebBundle:
         assert len(timeseries) == 2
         assert timeseries[0]["year"] == 2025
 
+    def test_timeseries_nulls_written_as_null(self, sample_run_dir: Path, tmp_path: Path) -> None:
+        ts_path = sample_run_dir / "timeseries.parquet"
+        ts_df = pd.read_parquet(ts_path)
+        ts_df.loc[1, "price"] = None
+        ts_df.to_parquet(ts_path, index=False)
+
+        out_dir = tmp_path / "web_output"
+        export_web_bundle(sample_run_dir, out_dir)
+
+        text = (out_dir / "timeseries.json").read_text()
+        assert "NaN" not in text
+        assert json.loads(text)[1]["price"] is None
+
+    def test_only_manifest_and_summary_indented(self, sample_run_dir: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "web_output"
+        export_web_bundle(sample_run_dir, out_dir)
+
+        assert "\n" in (out_dir / "manifest.json").read_text()
+        assert "\n" in (out_dir / "summary.json").read_text()
+        assert "\n" not in (out_dir / "timeseries.json").read_text()
+        assert "\n" not in (out_dir / "agent_traces.json").read_text()
+
     def test_creates_agents_json(self, sample_run_dir: Path, tmp_path: Path) -> None:
         out_dir = tmp_path / "web_output"
         export_web_bundle(sample_run_dir, out_dir)
@@ -533,6 +648,25 @@ class TestExportWebBundle:
             downloads / "agent_states.parquet"
         ).is_symlink()
 
+    def test_downloads_are_hard_links(self, sample_run_dir: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "web_output"
+        export_web_bundle(sample_run_dir, out_dir)
+        # Exporting again replaces the existing links
+        export_web_bundle(sample_run_dir, out_dir)
+
+        dst = out_dir / "downloads" / "timeseries.parquet"
+        assert not dst.is_symlink()
+        assert dst.samefile(sample_run_dir / "timeseries.parquet")
+
+    def test_downloads_symlinks_on_request(
+        self, sample_run_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AGENT_ZERO_WEB_SYMLINKS", "1")
+        out_dir = tmp_path / "web_output"
+        export_web_bundle(sample_run_dir, out_dir)
+
+        assert (out_dir / "downloads" / "timeseries.parquet").is_symlink()
+
     def test_raises_on_missing_manifest(self, tmp_path: Path) -> None:
         run_dir = tmp_path / "empty_run"
         run_dir.mkdir()
@@ -709,3 +843,181 @@ class TestRebuildWebIndex:
 
         with (runs_dir / "index.json").open() as f:
             assert json.load(f) == []
+
+    def test_unchanged_runs_reuse_previous_entry(self, tmp_path: Path) -> None:
+        runs_dir = tmp_path / "runs"
+        run_dir = runs_dir / "run-001"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"run_id": "run-001"}))
+
+        rebuild_web_index(runs_dir)
+        assert (runs_dir / ".index.meta.json").exists()
+
+        # Tamper with the cached entry: an unchanged run is not re-parsed
+        meta = json.loads((runs_dir / ".index.meta.json").read_text())
+        meta["run-001"][1]["run_id"] = "from-meta"
+        (runs_dir / ".index.meta.json").write_text(json.dumps(meta))
+        rebuild_web_index(runs_dir)
+
+        with (runs_dir / "index.json").open() as f:
+            assert json.load(f)[0]["run_id"] == "from-meta"
+
+    def test_changed_summary_is_reparsed(self, tmp_path: Path) -> None:
+        runs_dir = tmp_path / "runs"
+        run_dir = runs_dir / "run-001"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"run_id": "run-001"}))
+        rebuild_web_index(runs_dir)
+
+        (run_dir / "summary.json").write_text(json.dumps({"year_net_zero": 2040}))
+        rebuild_web_index(runs_dir)
+
+        with (runs_dir / "index.json").open() as f:
+            assert json.load(f)[0]["quick_summary"]["year_net_zero"] == 2040
+
+    def test_meta_is_not_published(self, tmp_path: Path) -> None:
+        runs_dir = tmp_path / "runs"
+        run_dir = runs_dir / "run-001"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"run_id": "run-001"}))
+        (runs_dir / "index.meta.json").write_text("{}")
+
+        rebuild_web_index(runs_dir)
+
+        published = sorted(p.name for p in runs_dir.iterdir() if not p.name.startswith("."))
+        assert published == ["index.json", "run-001"]
+
+    def test_corrupt_meta_falls_back_to_full_rebuild(self, tmp_path: Path) -> None:
+        runs_dir = tmp_path / "runs"
+        run_dir = runs_dir / "run-001"
+        run_dir.mkdir(parents=True)
+        (run_dir / "manifest.json").write_text(json.dumps({"run_id": "run-001"}))
+        (runs_dir / ".index.meta.json").write_text("not json")
+
+        rebuild_web_index(runs_dir)
+
+        with (runs_dir / "index.json").open() as f:
+            assert json.load(f)[0]["run_id"] == "run-001"
+
+
+class TestLoadAssumptionsUsed:
+    """Tests for _load_assumptions_used."""
+
+    def test_pack_load_cached_until_files_change(
+        self, data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        packs = tmp_path / "assumptions_packs"
+        shutil.copytree(data_dir / "assumptions_packs" / "baseline-v1", packs / "baseline-v1")
+        monkeypatch.setattr(export_web, "ASSUMPTIONS_PACKS_DIR", packs)
+        export_web._resolved_assumption_rows.cache_clear()
+
+        loads = []
+        original = export_web.load_assumptions_pack
+
+        def counting_load(pack_dir: Path) -> dict:
+            loads.append(pack_dir)
+            return original(pack_dir)
+
+        monkeypatch.setattr(export_web, "load_assumptions_pack", counting_load)
+        manifest = {"assumptions": {"id": "baseline-v1"}}
+
+        first = export_web._load_assumptions_used(manifest)
+        first[0]["value"] = -1.0
+        second = export_web._load_assumptions_used(manifest)
+        assert len(loads) == 1
+        assert second[0]["value"] != -1.0
+
+        with (packs / "baseline-v1" / "manifest.yaml").open("a") as f:
+            f.write("\n# edited\n")
+        export_web._load_assumptions_used(manifest)
+        assert len(loads) == 2
+
+    def test_failed_load_is_not_cached(
+        self, data_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        packs = tmp_path / "assumptions_packs"
+        shutil.copytree(data_dir / "assumptions_packs" / "baseline-v1", packs / "baseline-v1")
+        monkeypatch.setattr(export_web, "ASSUMPTIONS_PACKS_DIR", packs)
+        export_web._resolved_assumption_rows.cache_clear()
+
+        original = export_web.load_assumptions_pack
+        failures = [OSError("transient read error")]
+
+        def flaky_load(pack_dir: Path) -> dict:
+            if failures:
+                raise failures.pop()
+            return original(pack_dir)
+
+        monkeypatch.setattr(export_web, "load_assumptions_pack", flaky_load)
+        manifest = {"assumptions": {"id": "baseline-v1"}}
+
+        assert export_web._load_assumptions_used(manifest) == []
+        assert export_web._load_assumptions_used(manifest)
+
+
+class TestWriteRecordsJson:
+    """Tests for _write_records_json."""
+
+    def test_values_round_trip_exactly(self, tmp_path: Path) -> None:
+        rows = [
+            {"year": 2025, "region": "AUS", "price": 0.1 + 0.2},
+            {"year": 2026, "region": "NZ", "price": 1 / 3},
+            {"year": 2027, "region": None, "price": 1.2345678901234568e16},
+        ]
+        pd.DataFrame(rows).to_parquet(tmp_path / "timeseries.parquet")
+
+        export_web._write_records_json(tmp_path / "timeseries.parquet", tmp_path / "ts.json")
+
+        assert json.loads((tmp_path / "ts.json").read_text()) == rows
+
+    def test_missing_table_writes_empty_array(self, tmp_path: Path) -> None:
+        export_web._write_records_json(tmp_path / "timeseries.parquet", tmp_path / "ts.json")
+        assert json.loads((tmp_path / "ts.json").read_text()) == []
+
+
+class TestWriteJsonArray:
+    """Tests for _write_json_array."""
+
+    @pytest.mark.parametrize("n", [0, 1, 4, 5])
+    def test_matches_whole_list_encoding(
+        self, n: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(export_web, "_JSON_ARRAY_CHUNK", 2)
+        items = [{"agent_id": f"A{i}", "year": 2025 + i} for i in range(n)]
+
+        export_web._write_json_array(tmp_path / "streamed.json", iter(items))
+        export_web._write_json(tmp_path / "whole.json", items)
+
+        streamed = (tmp_path / "streamed.json").read_bytes()
+        assert streamed == (tmp_path / "whole.json").read_bytes()
+        assert json.loads(streamed) == items
+
+
+class TestWriteJson:
+    """Tests for _write_json."""
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_output_does_not_depend_on_orjson(
+        self, pretty: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        data = {
+            "cost": 1e-05,
+            "ratio": float("nan"),
+            "agents": np.int64(3),
+            "share": np.float32(0.5),
+            "name": "é",
+        }
+        export_web._write_json(tmp_path / "with_optional.json", data, pretty=pretty)
+
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "orjson", None)
+            reloaded = importlib.reload(export_web)
+            reloaded._write_json(tmp_path / "without_orjson.json", data, pretty=pretty)
+        importlib.reload(export_web)
+
+        written = (tmp_path / "with_optional.json").read_bytes()
+        assert written == (tmp_path / "without_orjson.json").read_bytes()
+        if pretty:
+            assert written == json.dumps(data, indent=2, default=str).encode()
+        else:
+            assert written == json.dumps(data, separators=(",", ":"), default=str).encode()
@@ -0,0 +1,56 @@
+"""Unit tests for deterministic run identifiers."""
+
+from __future__ import annotations
+
+from agent_zero.io.hashing import make_run_id
+
+
+def _run_id(**overrides: object) -> str:
+    kwargs: dict = {
+        "engine_version": "0.1.0",
+        "assumptions_hash": "abc",
+        "scenario_hash": None,
+        "years": [2025, 2026, 2027],
+        "seed": 0,
+    }
+    kwargs.update(overrides)
+    return make_run_id(**kwargs)
+
+
+class TestMakeRunId:
+    """Tests for make_run_id."""
+
+    def test_deterministic_12_hex_chars(self) -> None:
+        run_id = _run_id()
+        assert run_id == _run_id()
+        assert len(run_id) == 12
+        int(run_id, 16)
+
+    def test_range_and_list_hash_identically(self) -> None:
+        assert _run_id(years=range(2025, 2028)) == _run_id(years=[2025, 2026, 2027])
+
+    def test_each_input_changes_id(self) -> None:
+        base = _run_id()
+        assert _run_id(engine_version="0.2.0") != base
+        assert _run_id(assumptions_hash="abd") != base
+        assert _run_id(scenario_hash="xyz") != base
+        assert _run_id(years=[2025, 2027]) != base
+        assert _run_id(seed=1) != base
+        assert _run_id(opts={"k": 1}) != base
+
+    def test_missing_scenario_differs_from_empty_hash(self) -> None:
+        assert _run_id(scenario_hash=None) != _run_id(scenario_hash="")
+
+    def test_stepped_years_differ_from_contiguous_span(self) -> None:
+        assert _run_id(years=range(2025, 2051, 5)) != _run_id(years=range(2025, 2051))
+
+    def test_field_boundaries_are_unambiguous(self) -> None:
+        assert _run_id(engine_version="0.1", assumptions_hash="0abc") != _run_id(
+            engine_version="0.10", assumptions_hash="abc"
+        )
+
+    def test_seeds_outside_int64_are_accepted(self) -> None:
+        big = _run_id(seed=2**64)
+        assert len(big) == 12
+        assert big != _run_id(seed=-(2**64))
+        assert big != _run_id(seed=0)
@@ -8,6 +8,7 @@ from pathlib import Path
 import pandas as pd
 
 from agent_zero.io.load_pack import (
+    MODEL_COLUMNS,
     _read_table,
     load_assumptions_pack,
     load_manifest,
@@ -34,6 +35,21 @@ class TestLoadManifest:
         assert manifest["type"] == "scenario"
         assert manifest["base_assumptions_id"] == "tiny-baseline"
 
+    def test_load_manifest_returns_independent_copies(self, test_data_dir: Path) -> None:
+        pack_dir = test_data_dir / "assumptions_packs" / "tiny-baseline"
+        first = load_manifest(pack_dir)
+        first["id"] = "changed"
+
+        assert load_manifest(pack_dir)["id"] == "tiny-baseline"
+
+    def test_load_manifest_rereads_edited_file(self, tmp_path: Path) -> None:
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text("id: first\n")
+        assert load_manifest(tmp_path)["id"] == "first"
+
+        manifest_path.write_text("id: second-version\n")
+        assert load_manifest(tmp_path)["id"] == "second-version"
+
 
 class TestReadTable:
     """Tests for _read_table()."""
@@ -68,6 +84,48 @@ class TestReadTable:
             assert list(result.columns) == ["a", "b"]
             assert len(result) == 2
 
+    def test_read_table_csv_empty_fields_are_null(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "patches.csv"
+        csv_path.write_text(
+            "region,sector,tech,year,value,start,at\n"
+            "AUS,,,2025,1.5,2025-01-01,2025-01-01T06:00\n"
+            "AUS,,solar,,2.0,,2026-07-01 00:00:00\n"
+        )
+
+        result = _read_table(csv_path.with_suffix(".parquet"))
+
+        pd.testing.assert_frame_equal(result, pd.read_csv(csv_path))
+        assert result["sector"].isna().all()
+        assert result["tech"].isna().iloc[0]
+        assert result["start"].iloc[0] == "2025-01-01"
+        assert result["at"].tolist() == ["2025-01-01T06:00", "2026-07-01 00:00:00"]
+
+    def test_read_table_parquet(self, tmp_path: Path) -> None:
+        test_df = pd.DataFrame({"tech": ["solar", "wind"], "year": [2025, 2026]})
+        parquet_path = tmp_path / "test.parquet"
+        test_df.to_parquet(parquet_path, index=False)
+
+        result = _read_table(parquet_path)
+
+        pd.testing.assert_frame_equal(result, pd.read_parquet(parquet_path))
+
+    def test_read_table_columns_prunes_parquet(self, tmp_path: Path) -> None:
+        test_df = pd.DataFrame({"tech": ["solar"], "notes": ["x"], "value": [1.0]})
+        parquet_path = tmp_path / "test.parquet"
+        test_df.to_parquet(parquet_path, index=False)
+
+        result = _read_table(parquet_path, columns={"value", "tech", "missing"})
+
+        assert list(result.columns) == ["tech", "value"]
+
+    def test_read_table_columns_prunes_csv(self, tmp_path: Path) -> None:
+        csv_path = tmp_path / "test.csv"
+        csv_path.write_text("tech,notes,value\nsolar,x,1.0\n")
+
+        result = _read_table(csv_path.with_suffix(".parquet"), columns={"value", "tech", "missing"})
+
+        assert list(result.columns) == ["tech", "value"]
+
 
 class TestLoadAssumptionsPack:
     """Tests for load_assumptions_pack()."""
@@ -104,6 +162,15 @@ class TestLoadAssumptionsPack:
         assert pack["manifest"]["type"] == "assumptions"
         assert len(pack["assumptions"]) >= 1
 
+    def test_model_columns_only(self, test_data_dir: Path) -> None:
+        pack = load_assumptions_pack(
+            test_data_dir / "assumptions_packs" / "tiny-baseline", model_columns_only=True
+        )
+
+        assert "uncertainty_band" not in pack["assumptions"].columns
+        assert set(pack["assumptions"].columns) <= MODEL_COLUMNS
+        assert set(pack["policy"].columns) <= MODEL_COLUMNS
+
 
 class TestLoadScenarioPack:
     """Tests for load_scenario_pack()."""
@@ -590,6 +590,62 @@ class TestMultiplePatches:
         matched = new_assum.query("region == 'AUS' and tech == 'solar' and year == 2025")
         assert matched.iloc[0]["value"] == 180.0  # 90 * 2
 
+    def test_overlapping_patches_with_same_operation(self, sample_assumptions, sample_policy):
+        """Overlapping patches in one run combine as if applied one at a time."""
+
+        def patch(operation, value, **dims):
+            row = {"target": "assumptions", "operation": operation, "value": value}
+            row.update({c: dims.get(c) for c in DIM_COLS})
+            row["unit"] = "USD/kW"
+            return row
+
+        patches = pd.DataFrame(
+            [
+                patch("replace", 90.0, region="AUS"),
+                patch("replace", 70.0, region="AUS", tech="solar", year=2025),
+                patch("scale", 2.0, tech="solar"),
+                patch("scale", 0.5, region="AUS", tech="solar", year=2030),
+                patch("add", 5.0, param="capex"),
+                patch("add", 1.0, region="USA"),
+            ]
+        )
+
+        new_assum, _ = apply_patches(sample_assumptions, sample_policy, patches)
+
+        values = new_assum.set_index(["region", "tech", "year"])["value"]
+        assert values[("AUS", "solar", 2025)] == 70.0 * 2 + 5
+        assert values[("AUS", "wind", 2025)] == 90.0 + 5
+        assert values[("USA", "solar", 2025)] == 120.0 * 2 + 5 + 1
+        assert values[("AUS", "solar", 2030)] == 90.0 * 2 * 0.5 + 5
+        assert values[("AUS", "ev", 2025)] == 90.0
+
+    @pytest.mark.parametrize(
+        ("operation", "values"), [("add", [0.2, 0.3]), ("scale", [0.1, 3.0, 0.7])]
+    )
+    def test_same_operation_run_rounds_like_sequential_application(
+        self, sample_assumptions, sample_policy, operation, values
+    ):
+        """Non-representable values give bit-identical results to one-at-a-time patches."""
+        base = sample_assumptions.assign(value=0.1)
+        patches = pd.DataFrame(
+            [
+                {"target": "assumptions", "operation": operation, "value": v, "unit": "USD/kW"}
+                | dict.fromkeys(DIM_COLS)
+                for v in values
+            ]
+        )
+
+        new_assum, _ = apply_patches(base, sample_policy, patches)
+
+        expected = 0.1
+        for v in values:
+            expected = expected * v if operation == "scale" else expected + v
+        assert new_assum["value"].tolist() == [expected] * len(base)
+        sequential = base
+        for i in range(len(patches)):
+            sequential, _ = apply_patches(sequential, sample_policy, patches.iloc[[i]])
+        assert_frame_equal(new_assum, sequential)
+
     def test_patches_to_both_tables(self, sample_assumptions, sample_policy):
         """Patches can target both tables in same call."""
         patches = pd.DataFrame(
@@ -695,6 +751,31 @@ class TestMultiplePatches:
         assert len(matched) == 1
         assert matched.iloc[0]["value"] == 150.0  # 300 * 0.5
 
+    def test_new_rows_appended_in_order_and_visible_to_later_patches(
+        self, sample_assumptions, sample_policy
+    ):
+        """Rows added by replace keep patch order and are matched by later patches."""
+
+        def patch(value, **dims):
+            row = {"target": "assumptions", "operation": "replace", "value": value}
+            row.update({c: dims.get(c) for c in DIM_COLS})
+            row["unit"] = "USD/kW"
+            return row
+
+        patches = pd.DataFrame(
+            [
+                patch(300.0, region="AUS", tech="hydrogen", year=2025, param="capex"),
+                patch(400.0, region="AUS", tech="nuclear", year=2025, param="capex"),
+                patch(350.0, tech="hydrogen"),
+            ]
+        )
+
+        new_assum, _ = apply_patches(sample_assumptions, sample_policy, patches)
+
+        added = new_assum.iloc[len(sample_assumptions) :]
+        assert added["tech"].tolist() == ["hydrogen", "nuclear"]
+        assert added["value"].tolist() == [350.0, 400.0]
+
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
@@ -728,6 +809,14 @@ class TestEdgeCases:
             check_dtype=False,
         )
 
+    def test_none_patches(self, sample_assumptions, sample_policy):
+        """None patches returns unchanged tables."""
+        new_assum, new_policy = apply_patches(sample_assumptions, sample_policy, None)
+
+        assert_frame_equal(new_assum[sample_assumptions.columns], sample_assumptions)
+        assert_frame_equal(new_policy[sample_policy.columns], sample_policy)
+        assert set(DIM_COLS) <= set(new_policy.columns)
+
     def test_no_matching_rows_for_scale(self, sample_assumptions, sample_policy):
         """Scale on non-matching rows has no effect."""
         patches = pd.DataFrame(
@@ -806,6 +895,31 @@ class TestEdgeCases:
         assert_frame_equal(sample_assumptions, original_assum)
         assert_frame_equal(sample_policy, original_policy)
 
+    def test_untargeted_table_not_modified(self, sample_assumptions, sample_policy):
+        """A table no patch targets is returned with dimension columns, input intact."""
+        original_policy = sample_policy.copy()
+        patches = pd.DataFrame(
+            [
+                {
+                    "target": "assumptions",
+                    "region": "AUS",
+                    "sector": "energy",
+                    "tech": "solar",
+                    "year": 2025,
+                    "param": "capex",
+                    "operation": "scale",
+                    "value": 2.0,
+                    "unit": "USD/kW",
+                }
+            ]
+        )
+
+        _, new_policy = apply_patches(sample_assumptions, sample_policy, patches)
+
+        assert set(DIM_COLS) <= set(new_policy.columns)
+        assert_frame_equal(sample_policy, original_policy)
+        assert_frame_equal(new_policy[sample_policy.columns], original_policy)
+
     def test_dim_cols_constant(self):
         """DIM_COLS contains expected dimension columns."""
         expected = ["region", "sector", "tech", "year", "param"]
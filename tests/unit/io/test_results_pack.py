@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import importlib
 import json
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 import pandas as pd
 import pytest
 import yaml
 
-from agent_zero.post.results_pack import UNITS, write_run_bundle
+from agent_zero.post import results_pack
+from agent_zero.post.results_pack import RUNS_INDEX, UNITS, update_runs_index, write_run_bundle
 from agent_zero.utils.types import Action, AgentState, WorldState
 
 
@@ -182,6 +187,19 @@ class TestTimeseriesParquet:
             assert pd.api.types.is_float_dtype(ts_df["supply"])
             assert pd.api.types.is_float_dtype(ts_df["emissions"])
 
+    def test_tables_written_with_zstd(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = write_run_bundle(
+                Path(tmpdir), "test-run", synthetic_history, sample_manifests, seed=42
+            )
+            for name in ("timeseries.parquet", "agent_states.parquet"):
+                meta = pq.ParquetFile(run_dir / name).metadata
+                assert meta.row_group(0).column(0).compression == "ZSTD"
+
     def test_emissions_deduplicated_correctly(
         self, synthetic_history: list, sample_manifests: dict
     ) -> None:
@@ -208,6 +226,25 @@ class TestTimeseriesParquet:
 
             assert "carbon" not in ts_df["commodity"].values
 
+    def test_timeseries_regions_sorted(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        """Rows follow a fixed region order, independent of set iteration order."""
+        history = []
+        for world, agents, actions in synthetic_history:
+            regions = ["NZ", "AUS", "USA", "EU"]
+            moved = [replace(ag, region=r) for ag, r in zip(agents, regions, strict=True)]
+            history.append((world, moved, actions))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = write_run_bundle(Path(tmpdir), "test-run", history, sample_manifests)
+            ts_df = pd.read_parquet(run_dir / "timeseries.parquet")
+
+            first_year = ts_df[ts_df["year"] == 2025]
+            assert first_year["region"].tolist() == [
+                region for region in ["AUS", "EU", "NZ", "USA"] for _ in range(2)
+            ]
+
     def test_timeseries_ids_populated(
         self, synthetic_history: list, sample_manifests: dict
     ) -> None:
@@ -247,6 +284,24 @@ class TestAgentStatesParquet:
             for col in required_cols:
                 assert col in ag_df.columns, f"Missing column: {col}"
 
+    def test_rows_follow_history_order(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        """One row per agent per step, in step then agent order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = write_run_bundle(
+                Path(tmpdir), "test-run", synthetic_history, sample_manifests, seed=42
+            )
+            ag_df = pd.read_parquet(run_dir / "agent_states.parquet")
+
+            expected = [
+                (world.t, ag.id, ag.capacity)
+                for world, agents, _ in synthetic_history
+                for ag in agents
+            ]
+            actual = list(zip(ag_df["year"], ag_df["agent_id"], ag_df["capacity"], strict=True))
+            assert actual == expected
+
     def test_investment_matches_action_invest_sum(
         self, synthetic_history: list, sample_manifests: dict
     ) -> None:
@@ -440,6 +495,39 @@ class TestSummaryJson:
                 assert "shortage_frequency" in sos[commodity]
                 assert "min_supply_demand_ratio" in sos[commodity]
 
+    def test_security_of_supply_values(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        """Supply falls short of demand in every year of the synthetic history."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = write_run_bundle(
+                Path(tmpdir), "test-run", synthetic_history, sample_manifests, seed=42
+            )
+
+            with open(run_dir / "summary.json") as f:
+                summary = json.load(f)
+
+            sos = summary["security_of_supply"]
+            assert list(sos) == ["electricity", "hydrogen"]
+            assert sos["electricity"]["shortage_frequency"] == 1.0
+            assert sos["electricity"]["min_supply_demand_ratio"] == pytest.approx(90.0 / 1000.0)
+            assert sos["hydrogen"]["min_supply_demand_ratio"] == pytest.approx(45.0 / 200.0)
+
+
+class TestAgentStateJson:
+    """Tests for the JSON payloads stored in agent_states."""
+
+    def test_encoding_does_not_depend_on_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        payload = {"cost": 1e-05, "ratio": float("nan"), "peak": float("inf"), "name": "é"}
+        with_optional = results_pack._to_json(payload)
+
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "orjson", None)
+            without_orjson = importlib.reload(results_pack)._to_json(payload)
+        importlib.reload(results_pack)
+
+        assert with_optional == without_orjson == json.dumps(payload)
+
 
 class TestManifestYaml:
     """Tests for manifest.yaml output."""
@@ -545,11 +633,64 @@ class TestManifestYaml:
             assert manifest["seed"] == 42
 
 
+class TestRunsIndex:
+    """Tests for the runs index updated by write_run_bundle."""
+
+    def test_index_records_listing_fields(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_run_bundle(Path(tmpdir), "run-a", synthetic_history, sample_manifests, seed=42)
+            write_run_bundle(Path(tmpdir), "run-b", synthetic_history, sample_manifests, seed=42)
+
+            index = json.loads((Path(tmpdir) / RUNS_INDEX).read_text())
+            assert set(index) == {"run-a", "run-b"}
+            assert index["run-a"]["years"] == [2025, 2026, 2027]
+            assert index["run-a"]["assumptions"]["id"] == "baseline-v1"
+            assert index["run-a"]["scenario"]["id"] == "fast-elec-v1"
+
+    def test_corrupt_index_is_replaced(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / RUNS_INDEX).write_text("not json")
+            write_run_bundle(Path(tmpdir), "run-a", synthetic_history, sample_manifests, seed=42)
+
+            index = json.loads((Path(tmpdir) / RUNS_INDEX).read_text())
+            assert list(index) == ["run-a"]
+
+    def test_index_records_manifest_stat(
+        self, synthetic_history: list, sample_manifests: dict
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run_dir = write_run_bundle(
+                Path(tmpdir), "run-a", synthetic_history, sample_manifests, seed=42
+            )
+
+            index = json.loads((Path(tmpdir) / RUNS_INDEX).read_text())
+            st = (run_dir / "manifest.yaml").stat()
+            assert index["run-a"]["manifest_stat"] == [st.st_mtime_ns, st.st_size]
+
+    def test_concurrent_updates_keep_all_entries(self, tmp_path: Path) -> None:
+        run_ids = [f"run-{i}" for i in range(16)]
+        for run_id in run_ids:
+            (tmp_path / run_id).mkdir()
+            (tmp_path / run_id / "manifest.yaml").write_text(f"run_id: {run_id}\n")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda r: update_runs_index(tmp_path, {"run_id": r}), run_ids))
+
+        index = json.loads((tmp_path / RUNS_INDEX).read_text())
+        assert set(index) == set(run_ids)
+
+
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
     def test_no_scenario_manifest(self, synthetic_history: list) -> None:
         """Should handle missing scenario manifest gracefully."""
+        import pyarrow.parquet as pq
+
         manifests = {
             "assumptions": {"id": "baseline-v1", "hash": "abc", "version": "1.0.0"},
         }
@@ -560,6 +701,8 @@ class TestEdgeCases:
 
             ts_df = pd.read_parquet(run_dir / "timeseries.parquet")
             assert ts_df["scenario_id"].isna().all()
+            schema = pq.read_schema(run_dir / "timeseries.parquet")
+            assert str(schema.field("scenario_id").type) == "string"
 
             with open(run_dir / "manifest.yaml") as f:
                 manifest = yaml.safe_load(f)
@@ -591,3 +734,19 @@ class TestEdgeCases:
             assert (run_dir / "agent_states.parquet").exists()
             assert (run_dir / "summary.json").exists()
             assert (run_dir / "manifest.yaml").exists()
+
+    def test_no_run_directory_left_on_failure(self, sample_manifests: dict) -> None:
+        """A history that cannot be tabulated should not leave an empty run directory."""
+        world = WorldState(
+            t=2025,
+            prices={"electricity": 50.0},
+            demand={},
+            policy=pd.DataFrame(),
+            assumptions=pd.DataFrame(),
+        )
+        agent = AgentState(id="a", agent_type="Regulator", region="AUS")
+        # one agent but no actions: zip(strict=True) fails while building rows
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                write_run_bundle(Path(tmpdir), "bad-run", [(world, [agent], [])], sample_manifests)
+            assert not (Path(tmpdir) / "bad-run").exists()
@@ -11,6 +11,7 @@ import yaml
 
 from agent_zero.post.results_validation import (
     ValidationIssue,
+    _check_dtype,
     _load_schema,
     validate_agent_states,
     validate_bundle,
@@ -305,6 +306,23 @@ class TestValidateBundle:
         errors = [i for i in issues if i.level == "error"]
         assert len(errors) == 0
 
+    def test_parquet_values_checked(
+        self, tmp_path: Path, valid_timeseries_df: pd.DataFrame
+    ) -> None:
+        """Minimum constraints and missing columns are reported from Parquet files."""
+        df = valid_timeseries_df.drop(columns="run_id")
+        df.loc[0, "price"] = -1.0
+        df.loc[1, "emissions"] = -5.0
+        df.to_parquet(tmp_path / "timeseries.parquet")
+
+        issues = validate_bundle(tmp_path)
+        ts_issues = {(i.level, i.location) for i in issues if i.location.startswith("timeseries.")}
+        assert ts_issues == {
+            ("error", "timeseries.run_id"),
+            ("error", "timeseries.price"),
+            ("warning", "timeseries.emissions"),
+        }
+
     def test_csv_files_accepted(self, tmp_path: Path) -> None:
         """Bundle should accept CSV files as alternative to parquet."""
         ts_df = pd.DataFrame(
@@ -390,6 +408,16 @@ class TestValidationIssue:
         assert issue.level == "warning"
 
 
+class TestCheckDtype:
+    @pytest.mark.parametrize("value", [2025, 2025.0, -3])
+    def test_int_accepts_integral_numbers(self, value: object) -> None:
+        assert _check_dtype(value, "int")
+
+    @pytest.mark.parametrize("value", [2025.5, float("nan"), float("inf"), True, "2025"])
+    def test_int_rejects_other_values(self, value: object) -> None:
+        assert not _check_dtype(value, "int")
+
+
 class TestLoadSchema:
     def test_schema_loads(self) -> None:
         """Schema should load successfully."""
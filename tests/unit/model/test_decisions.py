@@ -0,0 +1,49 @@
+"""Unit tests for agent_zero.model.decisions parameter lookups."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from agent_zero.model.decisions import _forecast_npv, _lookup_param
+
+
+def _assumptions(rows: list[tuple[str, int, str, float]]) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["tech", "year", "param", "value"])
+
+
+class TestLookupParam:
+    """Tests for _lookup_param()."""
+
+    def test_returns_matching_value(self):
+        """_lookup_param() returns the value for a matching row."""
+        df = _assumptions([("electricity", 2025, "capex", 900.0)])
+        assert _lookup_param(df, "electricity", 2025, "capex", 1.0) == 900.0
+
+    def test_returns_default_when_missing(self):
+        """_lookup_param() falls back to the default when no row matches."""
+        df = _assumptions([("electricity", 2025, "capex", 900.0)])
+        assert _lookup_param(df, "electricity", 2026, "capex", 1.0) == 1.0
+        assert _lookup_param(df, "hydrogen", 2025, "capex", 2.0) == 2.0
+
+    def test_first_duplicate_wins(self):
+        """_lookup_param() returns the first matching row, as boolean indexing did."""
+        df = _assumptions(
+            [("electricity", 2025, "capex", 900.0), ("electricity", 2025, "capex", 500.0)]
+        )
+        assert _lookup_param(df, "electricity", 2025, "capex", 1.0) == 900.0
+
+
+class TestForecastNpv:
+    """Tests for _forecast_npv()."""
+
+    def test_flat_prices_without_discounting(self):
+        """With no trend or discounting, npv is the summed margin less capex."""
+        npv, expected_price = _forecast_npv(50.0, 0.0, 3, 100.0, 10.0, 0.5, 20.0, 0.0)
+        assert npv == 3 * (50.0 - 10.0 - 0.5 * 20.0) - 100.0
+        assert expected_price == 50.0
+
+    def test_expected_price_is_mean_of_trend(self):
+        """expected_price is the mean of the linear price forecast."""
+        _, expected_price = _forecast_npv(100.0, 0.3, 3, 0.0, 0.0, 0.0, 0.0, 0.07)
+        assert expected_price == pytest.approx((110.0 + 120.0 + 130.0) / 3)
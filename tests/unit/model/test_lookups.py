@@ -0,0 +1,39 @@
+"""Unit tests for agent_zero.model.lookups."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from agent_zero.model.lookups import ASSUMPTION_KEYS, POLICY_KEYS, carbon_price, table_index
+
+
+class TestTableIndex:
+    """Tests for table_index()."""
+
+    def test_index_is_cached_per_frame(self):
+        """table_index() builds the index once per frame and key set."""
+        df = pd.DataFrame(
+            [("electricity", 2025, "capex", 900.0)], columns=["tech", "year", "param", "value"]
+        )
+        other = df.copy()
+        assert table_index(df, ASSUMPTION_KEYS) is table_index(df, ASSUMPTION_KEYS)
+        assert table_index(other, ASSUMPTION_KEYS) is not table_index(df, ASSUMPTION_KEYS)
+        assert table_index(df, ("tech",)) == {("electricity",): 900.0}
+
+    def test_policy_index_keys(self, tiny_policy: pd.DataFrame):
+        """table_index() keys policy rows by (year, policy_type)."""
+        index = table_index(tiny_policy, POLICY_KEYS)
+        assert index[(2026, "carbon_price")] == 25.0
+
+
+class TestCarbonPrice:
+    """Tests for carbon_price()."""
+
+    def test_returns_price_for_year(self, tiny_policy: pd.DataFrame):
+        """carbon_price() returns the policy value for the year."""
+        assert carbon_price(tiny_policy, 2026) == 25.0
+
+    def test_returns_none_when_unset(self):
+        """carbon_price() returns None when the policy has no carbon price."""
+        empty = pd.DataFrame(columns=["region", "sector", "year", "policy_type", "value", "unit"])
+        assert carbon_price(empty, 2025) is None
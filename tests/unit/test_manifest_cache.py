@@ -0,0 +1,51 @@
+"""Unit tests for the in-process manifest cache used by the CLI."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agent_zero.cli import _cached_manifest, _load_manifest_cached
+
+
+@pytest.fixture
+def pack_dir(tmp_path: Path) -> Path:
+    """Create a pack directory with a minimal manifest."""
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    (pack / "manifest.yaml").write_text('id: "tiny"\ntype: "assumptions"\n')
+    return pack
+
+
+class TestCachedManifest:
+    """Tests for _cached_manifest."""
+
+    def test_parses_manifest(self, pack_dir: Path) -> None:
+        assert _cached_manifest(pack_dir) == {"id": "tiny", "type": "assumptions"}
+
+    def test_cache_hit_returns_same_manifest(self, pack_dir: Path) -> None:
+        first = _cached_manifest(pack_dir)
+        assert _cached_manifest(pack_dir) is first
+
+    def test_edit_invalidates_entry(self, pack_dir: Path) -> None:
+        manifest_path = pack_dir / "manifest.yaml"
+        _cached_manifest(pack_dir)
+        manifest_path.write_text('id: "tiny-v2"\ntype: "scenario"\n')
+        st = manifest_path.stat()
+        os.utime(manifest_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert _cached_manifest(pack_dir) == {"id": "tiny-v2", "type": "scenario"}
+
+    def test_missing_manifest_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            _cached_manifest(tmp_path)
+
+
+class TestLoadManifestCached:
+    """Tests for _load_manifest_cached on run manifests."""
+
+    def test_run_manifest(self, tmp_path: Path) -> None:
+        manifest_path = tmp_path / "manifest.yaml"
+        manifest_path.write_text("run_id: abc\nyears:\n  start: 2025\n  end: 2030\n")
+        assert _load_manifest_cached(manifest_path)["years"] == {"start": 2025, "end": 2030}
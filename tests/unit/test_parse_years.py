@@ -12,15 +12,15 @@ class TestParseYearsRange:
 
     def test_basic_range(self) -> None:
         """Test simple start:end range."""
-        assert parse_years("2024:2030") == [2024, 2025, 2026, 2027, 2028, 2029, 2030]
+        assert list(parse_years("2024:2030")) == [2024, 2025, 2026, 2027, 2028, 2029, 2030]
 
     def test_single_year_range(self) -> None:
         """Test range where start equals end."""
-        assert parse_years("2025:2025") == [2025]
+        assert list(parse_years("2025:2025")) == [2025]
 
     def test_range_with_whitespace(self) -> None:
         """Test range with leading/trailing whitespace."""
-        assert parse_years("  2024:2026  ") == [2024, 2025, 2026]
+        assert list(parse_years("  2024:2026  ")) == [2024, 2025, 2026]
 
 
 class TestParseYearsRangeWithStep:
@@ -28,23 +28,23 @@ class TestParseYearsRangeWithStep:
 
     def test_step_of_5(self) -> None:
         """Test range with step of 5."""
-        assert parse_years("2024:5:2050") == [2024, 2029, 2034, 2039, 2044, 2049]
+        assert list(parse_years("2024:5:2050")) == [2024, 2029, 2034, 2039, 2044, 2049]
 
     def test_step_of_10(self) -> None:
         """Test range with step of 10."""
-        assert parse_years("2020:10:2050") == [2020, 2030, 2040, 2050]
+        assert list(parse_years("2020:10:2050")) == [2020, 2030, 2040, 2050]
 
     def test_step_not_divisible(self) -> None:
         """Test range where step doesn't evenly divide the range."""
-        assert parse_years("2020:3:2025") == [2020, 2023]
+        assert list(parse_years("2020:3:2025")) == [2020, 2023]
 
     def test_step_of_1(self) -> None:
         """Test explicit step of 1."""
-        assert parse_years("2024:1:2027") == [2024, 2025, 2026, 2027]
+        assert list(parse_years("2024:1:2027")) == [2024, 2025, 2026, 2027]
 
     def test_step_larger_than_range(self) -> None:
         """Test step larger than range returns only start."""
-        assert parse_years("2024:100:2030") == [2024]
+        assert list(parse_years("2024:100:2030")) == [2024]
 
 
 class TestParseYearsList:
@@ -62,7 +62,7 @@ class TestParseYearsList:
 
     def test_single_item_list(self) -> None:
         """Test single-item list."""
-        assert parse_years("2025") == [2025]
+        assert list(parse_years("2025")) == [2025]
 
     def test_list_with_spaces(self) -> None:
         """Test list with spaces around values."""
@@ -112,3 +112,41 @@ class TestParseYearsErrors:
         """Test completely invalid input."""
         with pytest.raises(ValueError, match="Invalid year specification"):
             parse_years("invalid")
+
+
+class TestParseYearsSequenceType:
+    """Tests for the returned sequence type."""
+
+    def test_range_spec_returns_range(self) -> None:
+        """Range specifications are not materialised into a list."""
+        assert parse_years("2024:5:2050") == range(2024, 2051, 5)
+
+    def test_explicit_list_returns_sorted_list(self) -> None:
+        """Explicit year lists are returned as a sorted list."""
+        assert parse_years("2030,2024") == [2024, 2030]
+
+
+def test_run_id_independent_of_sequence_type() -> None:
+    """make_run_id hashes a range and the equivalent list identically."""
+    from agent_zero.io.hashing import make_run_id
+
+    years = parse_years("2025:2030")
+    assert make_run_id("0.1.0", "a", None, years=years, seed=0) == make_run_id(
+        "0.1.0", "a", None, years=list(years), seed=0
+    )
+
+
+def test_empty_range_bound_rejected() -> None:
+    """A missing start or end around the separator is a format error."""
+    with pytest.raises(ValueError, match="Invalid year range format"):
+        parse_years("2024:")
+    with pytest.raises(ValueError, match="Invalid year range format"):
+        parse_years(":5:2050")
+
+
+def test_cached_result_not_shared_with_caller() -> None:
+    """Mutating a returned list does not affect later calls for the same spec."""
+    years = parse_years("2040,2030")
+    assert isinstance(years, list)
+    years.append(2050)
+    assert parse_years("2040,2030") == [2030, 2040]